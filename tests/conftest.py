@@ -19,6 +19,7 @@ if TYPE_CHECKING:
     from collections.abc import AsyncGenerator, AsyncIterator
 
     from httpx import AsyncClient
+    from litestar import Litestar
     from pytest_databases.docker.postgres import PostgresService
     from pytest_databases.docker.redis import RedisService
 
@@ -73,6 +74,8 @@ async def init_test_postgres(
     )
     with contextlib.suppress(asyncpg.exceptions.DuplicateDatabaseError):
         await admin_conn.execute(f"CREATE DATABASE {db_name}")
+    # The test database is disposable, so commits don't need to wait for the WAL flush
+    await admin_conn.execute(f"ALTER DATABASE {db_name} SET synchronous_commit = off")
     await admin_conn.close()
 
     # Now connect to the actual test database
@@ -151,23 +154,26 @@ async def _cleanup_non_constant_pg_data() -> None:
     Constant data (traits, sections, clans, etc.) is preserved. Uses DELETE (not
     TRUNCATE) to avoid CASCADE side effects on constant tables that have nullable FK
     relationships to these tables. Tables are ordered children-first so FK constraints
-    are satisfied. Rows registered via `register_session_id` are excluded.
+    are satisfied. Rows registered via `register_session_id` are excluded. All
+    statements are sent as a single script to avoid a round trip per table.
     """
-    conn = Tortoise.get_connection("default")
+    statements = []
     for table in _PG_CLEANUP_TABLES:
         preserved = _SESSION_PRESERVED_IDS.get(table)
         if preserved:
             placeholders = ", ".join(f"'{pid}'" for pid in preserved)
-            await conn.execute_query(f"DELETE FROM {table} WHERE id NOT IN ({placeholders})")  # noqa: S608
+            statements.append(f"DELETE FROM {table} WHERE id NOT IN ({placeholders})")  # noqa: S608
         else:
-            await conn.execute_query(f"DELETE FROM {table}")  # noqa: S608
+            statements.append(f"DELETE FROM {table}")  # noqa: S608
 
     # Custom traits (those owned by a character) are per-character rows tests write into
     # the otherwise-constant `trait` table. Their character_trait/quick_roll/dice_roll
-    # children are deleted by the loop above, so remove the orphaned definitions
+    # children are deleted by the statements above, so remove the orphaned definitions
     # here to keep them from leaking across tests. Constant seed traits, which have no
     # owning character, are never touched.
-    await conn.execute_query("DELETE FROM trait WHERE custom_for_character_id IS NOT NULL")
+    statements.append("DELETE FROM trait WHERE custom_for_character_id IS NOT NULL")
+
+    await Tortoise.get_connection("default").execute_script(";\n".join(statements))
 
 
 @pytest.fixture(autouse=True)
@@ -181,9 +187,9 @@ async def cleanup_pg_database() -> AsyncGenerator[None]:
     await _cleanup_non_constant_pg_data()
 
 
-@pytest.fixture(name="redis", autouse=True)
-async def fx_redis(redis_service: RedisService, worker_id: str) -> AsyncGenerator[Redis]:
-    """Redis instance for testing.
+@pytest.fixture(scope="session")
+async def session_redis(redis_service: RedisService, worker_id: str) -> AsyncGenerator[Redis]:
+    """Redis client shared by every test in the session.
 
     Each xdist worker gets its own Redis database (0-15) to prevent data leaks
     between parallel workers sharing the same Redis server.
@@ -193,18 +199,30 @@ async def fx_redis(redis_service: RedisService, worker_id: str) -> AsyncGenerato
 
     redis_client = Redis(host=redis_service.host, port=redis_service.port, db=db)
     yield redis_client
-    await redis_client.flushdb()
     await redis_client.aclose()
 
 
-@pytest.fixture(name="client")
-async def fx_client(redis: Redis, monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[AsyncClient]:
-    """Create an async HTTP client that connects to the app."""
-    from httpx import ASGITransport, AsyncClient
+@pytest.fixture(name="redis", autouse=True)
+async def fx_redis(session_redis: Redis) -> AsyncGenerator[Redis]:
+    """Redis instance for testing.
+
+    Reuses the session client and flushes the worker's database after each test.
+    """
+    yield session_redis
+    await session_redis.flushdb()
+
+
+@pytest.fixture(scope="session")
+def app(session_redis: Redis) -> Litestar:
+    """Build the Litestar application once per session.
+
+    Creating the app wires up every controller, plugin and middleware, so it is
+    shared across tests. Its Redis-backed stores point at the session client, whose
+    database is flushed after each test.
+    """
     from litestar_saq.cli import get_saq_plugin
 
     from vapi.asgi import create_app
-    from vapi.config.base import RedisSettings
     from vapi.server.core import ApplicationCore
     from vapi.server.tortoise_plugin import tortoise_lifespan
 
@@ -217,12 +235,23 @@ async def fx_client(redis: Redis, monkeypatch: pytest.MonkeyPatch) -> AsyncItera
     assert cache_config is not None
 
     saq_plugin = get_saq_plugin(app) if settings.saq.enabled else None
-    app_plugin = app.plugins.get(ApplicationCore)
-    monkeypatch.setattr(app_plugin, "redis", redis)
-    monkeypatch.setattr(app.stores.get(cache_config.store), "_redis", redis)
+    app.plugins.get(ApplicationCore).redis = session_redis
+    app.stores.get(cache_config.store)._redis = session_redis
     if saq_plugin and saq_plugin._config.queue_instances is not None:
         for queue in saq_plugin._config.queue_instances.values():
-            monkeypatch.setattr(queue, "redis", redis)
+            queue.redis = session_redis
+
+    return app
+
+
+@pytest.fixture(name="client")
+async def fx_client(
+    app: Litestar, redis: Redis, monkeypatch: pytest.MonkeyPatch
+) -> AsyncIterator[AsyncClient]:
+    """Create an async HTTP client that connects to the shared app."""
+    from httpx import ASGITransport, AsyncClient
+
+    from vapi.config.base import RedisSettings
 
     # Patch settings.redis.get_client to return our test Redis instance
     monkeypatch.setattr(RedisSettings, "get_client", lambda self: redis)
@@ -9,11 +9,11 @@ from typing import TYPE_CHECKING, Any
 import pytest
 
 from vapi.constants import GameVersion
-from vapi.db.sql_models.character_sheet import CharSheetSection, Trait, TraitCategory
+from vapi.db.sql_models.character_sheet import Trait, TraitCategory
 from vapi.utils.identity import VerifiedIdentity
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Awaitable, Callable
 
 pytestmark = pytest.mark.anyio
 
@@ -42,7 +42,7 @@ def build_verified_identity(**overrides: Any) -> VerifiedIdentity:
     return VerifiedIdentity(**defaults)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def build_url() -> Callable[..., str]:
     """Build a URL for tests using dummy default IDs.
 
@@ -50,52 +50,73 @@ def build_url() -> Callable[..., str]:
     not supply explicit IDs. Integration tests always pass real IDs via kwargs,
     so these defaults exist only to satisfy the str.format() substitution when
     a URL template contains placeholder keys the caller did not override.
+
+    Session-scoped: the defaults and pattern are prepared once, and each URL
+    template is normalized once and cached for the rest of the session.
     """
+    param_type_pattern = re.compile(r":[a-z]+}", flags=re.IGNORECASE)
+    defaults = {
+        "company_id": str(uuid.UUID("00000000-0000-0000-0000-000000000001")),
+        "user_id": str(uuid.UUID("00000000-0000-0000-0000-000000000002")),
+        "campaign_id": str(uuid.UUID("00000000-0000-0000-0000-000000000003")),
+        "character_id": str(uuid.UUID("00000000-0000-0000-0000-000000000004")),
+        "game_version": GameVersion.V5.name,
+        "book_id": str(uuid.UUID("00000000-0000-0000-0000-000000000005")),
+        "chapter_id": str(uuid.UUID("00000000-0000-0000-0000-000000000006")),
+    }
+
+    templates: dict[str, str] = {}
 
     def _build_url(url: str, **kwargs: Any) -> str:
-        url = re.sub(r":[a-z]+}", "}", url, flags=re.IGNORECASE)
-        defaults = {
-            "company_id": str(uuid.UUID("00000000-0000-0000-0000-000000000001")),
-            "user_id": str(uuid.UUID("00000000-0000-0000-0000-000000000002")),
-            "campaign_id": str(uuid.UUID("00000000-0000-0000-0000-000000000003")),
-            "character_id": str(uuid.UUID("00000000-0000-0000-0000-000000000004")),
-            "game_version": GameVersion.V5.name,
-            "book_id": str(uuid.UUID("00000000-0000-0000-0000-000000000005")),
-            "chapter_id": str(uuid.UUID("00000000-0000-0000-0000-000000000006")),
-        }
+        if url not in templates:
+            templates[url] = param_type_pattern.sub("}", url)
         replacements = defaults | {k: str(v) for k, v in kwargs.items()}
-        return url.format(**replacements)
+        return templates[url].format(**replacements)
 
     return _build_url
 
 
-@pytest.fixture
-async def all_traits_in_section() -> Callable[[str], list[Trait]]:
-    """Get all attribute traits."""
+@pytest.fixture(scope="session")
+def all_traits_in_section() -> Callable[[str], Awaitable[list[Trait]]]:
+    """Get all seeded traits in a character sheet section.
+
+    Session-scoped: seeded traits are constant, so each section is queried once and
+    the result is cached for the rest of the session. Custom traits are excluded
+    because they are deleted by the per-test cleanup.
+    """
+    cache: dict[str, list[Trait]] = {}
 
     async def _all_traits_in_section(section_name: str) -> list[Trait]:
-        section = await CharSheetSection.filter(name=section_name).first()
-        categories = await TraitCategory.filter(
-            section=section,
-            is_archived=False,
-        ).all()
-        return await Trait.filter(
-            category_id__in=[c.id for c in categories],
-            is_archived=False,
-        ).all()
+        if section_name not in cache:
+            cache[section_name] = await Trait.filter(
+                category__sheet_section__name=section_name,
+                category__is_archived=False,
+                is_archived=False,
+                custom_for_character_id__isnull=True,
+            )
+        return cache[section_name]
 
     return _all_traits_in_section
 
 
-@pytest.fixture
-async def all_traits_in_category() -> Callable[[str], list[Trait]]:
-    """Get all traits in a category."""
+@pytest.fixture(scope="session")
+def all_traits_in_category() -> Callable[[str], Awaitable[list[Trait]]]:
+    """Get all seeded traits in a trait category.
+
+    Session-scoped: seeded traits are constant, so each category is queried once and
+    the result is cached for the rest of the session. Custom traits are excluded
+    because they are deleted by the per-test cleanup.
+    """
+    cache: dict[str, list[Trait]] = {}
 
     async def _all_traits_in_category(category_name: str) -> list[Trait]:
-        category = await TraitCategory.filter(name=category_name).first()
-        return await Trait.filter(
-            category=category,
-            is_archived=False,
-        ).all()
+        if category_name not in cache:
+            category = await TraitCategory.filter(name=category_name).first()
+            cache[category_name] = await Trait.filter(
+                category=category,
+                is_archived=False,
+                custom_for_character_id__isnull=True,
+            )
+        return cache[category_name]
 
     return _all_traits_in_category
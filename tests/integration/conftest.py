@@ -11,6 +11,9 @@ import pytest
 from tests.conftest import register_session_id
 from vapi.constants import AUTH_HEADER_KEY, CompanyPermission
 from vapi.db.sql_models.campaign import Campaign, CampaignBook, CampaignChapter
+from vapi.db.sql_models.character_classes import VampireClan, WerewolfAuspice, WerewolfTribe
+from vapi.db.sql_models.character_concept import CharacterConcept
+from vapi.db.sql_models.character_sheet import CharSheetSection, Trait
 from vapi.db.sql_models.company import Company, CompanySettings
 from vapi.db.sql_models.developer import Developer, DeveloperCompanyPermission
 from vapi.db.sql_models.user import User
@@ -312,3 +315,85 @@ async def session_campaign_chapter(session_campaign_book: CampaignBook) -> Campa
     chapter = await CampaignChapter.get(id=str(chapter.id))
     register_session_id('"campaign_chapter"', str(chapter.id))
     return chapter
+
+
+# ---------------------------------------------------------------------------
+# Seed data fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="session")
+async def seed_vampire_clan() -> VampireClan:
+    """Return a seeded V5 vampire clan that has a bane and a compulsion.
+
+    Disciplines are prefetched so the clan can be serialized as a response.
+
+    Session-scoped: seed data is constant, so the lookup runs once per session.
+    """
+    clan = (
+        await VampireClan.filter(
+            is_archived=False,
+            game_versions__contains=["V5"],
+            bane_name__isnull=False,
+            compulsion_name__isnull=False,
+        )
+        .prefetch_related("disciplines")
+        .first()
+    )
+    assert clan is not None
+    return clan
+
+
+@pytest.fixture(scope="session")
+async def seed_character_concept() -> CharacterConcept:
+    """Return a seeded, company-independent character concept.
+
+    Session-scoped: seed data is constant, so the lookup runs once per session.
+    """
+    concept = await CharacterConcept.filter(is_archived=False, company_id__isnull=True).first()
+    assert concept is not None
+    return concept
+
+
+@pytest.fixture(scope="session")
+async def seed_werewolf_tribe() -> WerewolfTribe:
+    """Return a seeded werewolf tribe with its gifts prefetched.
+
+    Session-scoped: seed data is constant, so the lookup runs once per session.
+    """
+    tribe = await WerewolfTribe.filter(is_archived=False).prefetch_related("gifts").first()
+    assert tribe is not None
+    return tribe
+
+
+@pytest.fixture(scope="session")
+async def seed_werewolf_auspice() -> WerewolfAuspice:
+    """Return a seeded werewolf auspice with its gifts prefetched.
+
+    Session-scoped: seed data is constant, so the lookup runs once per session.
+    """
+    auspice = await WerewolfAuspice.filter(is_archived=False).prefetch_related("gifts").first()
+    assert auspice is not None
+    return auspice
+
+
+@pytest.fixture(scope="session")
+async def seed_sheet_section() -> CharSheetSection:
+    """Return a seeded character sheet section.
+
+    Session-scoped: seed data is constant, so the lookup runs once per session.
+    """
+    section = await CharSheetSection.filter(is_archived=False).first()
+    assert section is not None
+    return section
+
+
+@pytest.fixture(scope="session")
+async def seed_trait() -> Trait:
+    """Return a seeded, non-custom trait.
+
+    Session-scoped: seed data is constant, so the lookup runs once per session.
+    """
+    trait = await Trait.filter(is_archived=False, custom_for_character_id__isnull=True).first()
+    assert trait is not None
+    return trait
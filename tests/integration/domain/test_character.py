@@ -41,9 +41,8 @@ if TYPE_CHECKING:
 pytestmark = pytest.mark.anyio
 
 
-def _assert_character_response_shape(data: dict) -> None:
-    """Assert that a character response has the expected top-level keys."""
-    for key in (
+_CHARACTER_RESPONSE_KEYS = frozenset(
+    {
         "id",
         "name_first",
         "name_last",
@@ -60,8 +59,38 @@ def _assert_character_response_shape(data: dict) -> None:
         "chapter_ids",
         "date_created",
         "date_modified",
-    ):
-        assert key in data, f"Missing key '{key}' in character response"
+    }
+)
+
+_VALID_CREATE_CHARACTER_PAYLOAD = {
+    "name_first": "Test",
+    "name_last": "Character",
+    "character_class": "MORTAL",
+    "game_version": "V5",
+    "type": "PLAYER",
+    "biography": "Test biography",
+    "demeanor": "Test demeanor",
+    "nature": "Test nature",
+}
+
+# Valid create payloads with one field overridden by an invalid value. campaign_id is
+# added in the test because the session campaign does not exist at import time.
+_INVALID_CREATE_CHARACTER_PAYLOADS = [
+    _VALID_CREATE_CHARACTER_PAYLOAD | override
+    for override in (
+        {"game_version": "INVALID"},
+        {"type": "INVALID"},
+        {"character_class": "INVALID"},
+        {"concept_id": "INVALID"},
+        {"user_player_id": "INVALID"},
+    )
+]
+
+
+def _assert_character_response_shape(data: dict) -> None:
+    """Assert that a character response has the expected top-level keys."""
+    missing = _CHARACTER_RESPONSE_KEYS - data.keys()
+    assert not missing, f"Missing keys {sorted(missing)} in character response"
 
 
 class TestCharacterList:
@@ -1021,9 +1050,11 @@ class TestCharacterController:
         assert data["date_killed"] is not None
 
         # And the DB reflects the change
-        updated = await Character.get(id=character.id)
-        assert updated.name_first == "Updated name"
-        assert updated.status == CharacterStatus.DEAD
+        name_first, status = await Character.get(id=character.id).values_list(
+            "name_first", "status"
+        )
+        assert name_first == "Updated name"
+        assert status == CharacterStatus.DEAD
 
     async def test_delete_character(
         self,
@@ -1086,13 +1117,13 @@ class TestVampireAttributes:
         session_global_admin: Developer,
         session_user: User,
         session_campaign: Campaign,
+        seed_vampire_clan: VampireClan,
         token_global_admin: dict[str, str],
         on_behalf_of_header: dict[str, str],
     ) -> None:
         """Verify creating a vampire character populates clan attributes."""
         # Given a vampire clan from seed data
-        vampire_clan = await VampireClan.filter(is_archived=False, bane_name__isnull=False).first()
-        assert vampire_clan is not None
+        vampire_clan = seed_vampire_clan
 
         # When we create a vampire character
         response = await client.post(
@@ -1305,15 +1336,15 @@ class TestWerewolfAttributes:
         session_global_admin: Developer,
         session_user: User,
         session_campaign: Campaign,
+        seed_werewolf_tribe: WerewolfTribe,
+        seed_werewolf_auspice: WerewolfAuspice,
         token_global_admin: dict[str, str],
         on_behalf_of_header: dict[str, str],
     ) -> None:
         """Verify creating a werewolf character populates tribe and auspice attributes."""
         # Given seed data
-        werewolf_tribe = await WerewolfTribe.filter(is_archived=False).first()
-        werewolf_auspice = await WerewolfAuspice.filter(is_archived=False).first()
-        assert werewolf_tribe is not None
-        assert werewolf_auspice is not None
+        werewolf_tribe = seed_werewolf_tribe
+        werewolf_auspice = seed_werewolf_auspice
 
         # When we create a werewolf character
         response = await client.post(
@@ -1503,21 +1534,13 @@ class TestCharacterCreate:
         assert data["name_last"] == "Character"
         assert data["character_class"] == CharacterClass.MORTAL.value
 
-        # And the traits are persisted
-
-        ct_count = await CharacterTrait.filter(character_id=data["id"]).count()
-        assert ct_count == len(traits)
+        # And the submitted traits are persisted
+        persisted_trait_ids = await CharacterTrait.filter(character_id=data["id"]).values_list(
+            "trait_id", flat=True
+        )
+        assert sorted(persisted_trait_ids) == sorted(t.id for t in traits)
 
-    @pytest.mark.parametrize(
-        "json_data",
-        [
-            ({"game_version": "INVALID"}),
-            ({"type": "INVALID"}),
-            ({"character_class": "INVALID"}),
-            ({"concept_id": "INVALID"}),
-            ({"user_player_id": "INVALID"}),
-        ],
-    )
+    @pytest.mark.parametrize("json_data", _INVALID_CREATE_CHARACTER_PAYLOADS)
     async def test_create_character_invalid_parameters(
         self,
         client: AsyncClient,
@@ -1531,26 +1554,13 @@ class TestCharacterCreate:
         on_behalf_of_header: dict[str, str],
     ) -> None:
         """Verify 400 when creating a character with invalid parameters."""
-        correct_json_data = {
-            "name_first": "Test",
-            "name_last": "Character",
-            "character_class": "MORTAL",
-            "game_version": "V5",
-            "type": "PLAYER",
-            "biography": "Test biography",
-            "demeanor": "Test demeanor",
-            "nature": "Test nature",
-            "campaign_id": str(session_campaign.id),
-        }
-        base_json_data = {**correct_json_data, **json_data}
-
         response = await client.post(
             build_url(
                 CharacterURL.CREATE,
                 company_id=session_company.id,
             ),
             headers=token_global_admin | on_behalf_of_header,
-            json=base_json_data,
+            json=json_data | {"campaign_id": str(session_campaign.id)},
         )
         assert response.status_code == HTTP_400_BAD_REQUEST
 
@@ -1600,16 +1610,16 @@ class TestCharacterCreate:
         session_user: User,
         session_campaign: Campaign,
         user_factory: Callable[..., User],
-        character_concept_factory: Callable[..., CharacterConcept],
+        seed_vampire_clan: VampireClan,
+        seed_character_concept: CharacterConcept,
         token_global_admin: dict[str, str],
         on_behalf_of_header: dict[str, str],
     ) -> None:
         """Verify creating a character with all optional fields."""
         # Given a second user to be the player, a concept, and a vampire clan
         user_player = await user_factory(company=session_company)
-        vampire_clan = await VampireClan.filter(is_archived=False).first()
-        assert vampire_clan is not None
-        concept = await character_concept_factory()
+        vampire_clan = seed_vampire_clan
+        concept = seed_character_concept
 
         # And some traits from the Attributes section
         section = await CharSheetSection.filter(name="Attributes", is_archived=False).first()
@@ -1669,10 +1679,11 @@ class TestCharacterCreate:
         assert data["concept_name"] == concept.name
         assert data["user_player_id"] == str(user_player.id)
 
-        # And the character has the correct trait count in DB
-
-        ct_count = await CharacterTrait.filter(character_id=data["id"]).count()
-        assert ct_count >= len(traits)
+        # And the submitted traits are persisted
+        persisted_trait_ids = await CharacterTrait.filter(character_id=data["id"]).values_list(
+            "trait_id", flat=True
+        )
+        assert {t.id for t in traits} <= set(persisted_trait_ids)
 
     async def test_create_npc_with_player_is_rejected(
         self,
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
 import msgspec
 import pytest
@@ -32,12 +34,64 @@ from vapi.domain.controllers.character_blueprint.dto import (
 )
 from vapi.domain.urls import CharacterBlueprints
 
+_json_encoder = msgspec.json.Encoder()
+_json_decoder = msgspec.json.Decoder()
+
+
+def _to_json(value: object) -> Any:
+    """Return the JSON-compatible form of a response struct, or list of structs."""
+    return _json_decoder.decode(_json_encoder.encode(value))
+
 
 def _sort_id_lists(items: list[dict], key: str) -> list[dict]:
     """Return items with a specific list-of-ids field sorted for stable comparison."""
     return [{**item, key: sorted(item.get(key, []))} for item in items]
 
 
+@dataclass(frozen=True)
+class _ClassOption:
+    """A class-specific blueprint option exposed through list and detail endpoints."""
+
+    model: type[VampireClan | WerewolfTribe | WerewolfAuspice]
+    response: type[VampireClanResponse | WerewolfTribeResponse | WerewolfAuspiceResponse]
+    list_url: str
+    detail_url: str
+    id_param: str
+    related: str
+    ids_key: str
+
+
+_CLASS_OPTIONS = [
+    _ClassOption(
+        model=VampireClan,
+        response=VampireClanResponse,
+        list_url=CharacterBlueprints.VAMPIRE_CLANS,
+        detail_url=CharacterBlueprints.VAMPIRE_CLAN_DETAIL,
+        id_param="vampire_clan_id",
+        related="disciplines",
+        ids_key="discipline_ids",
+    ),
+    _ClassOption(
+        model=WerewolfTribe,
+        response=WerewolfTribeResponse,
+        list_url=CharacterBlueprints.WEREWOLF_TRIBES,
+        detail_url=CharacterBlueprints.WEREWOLF_TRIBE_DETAIL,
+        id_param="werewolf_tribe_id",
+        related="gifts",
+        ids_key="gift_trait_ids",
+    ),
+    _ClassOption(
+        model=WerewolfAuspice,
+        response=WerewolfAuspiceResponse,
+        list_url=CharacterBlueprints.WEREWOLF_AUSPICES,
+        detail_url=CharacterBlueprints.WEREWOLF_AUSPICE_DETAIL,
+        id_param="werewolf_auspice_id",
+        related="gifts",
+        ids_key="gift_trait_ids",
+    ),
+]
+
+
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
 
@@ -59,30 +113,30 @@ class TestSheetSection:
         token_company_admin: dict[str, str],
         session_company: Company,
         session_company_admin: Developer,
-        debug: Callable[[...], None],
     ) -> None:
         """Verify the list sheet sections endpoint is working."""
-        sheet_sections = await CharSheetSection.filter(
-            is_archived=False,
-            game_versions__contains=[GameVersion.V4.value],
-            character_classes__contains=[CharacterClass.VAMPIRE.value],
-        ).order_by("order")
-
-        response = await client.get(
-            build_url(CharacterBlueprints.SECTIONS, company_id=session_company.id),
-            headers=token_company_admin,
-            params={
-                "game_version": GameVersion.V4.name,
-                "character_class": CharacterClass.VAMPIRE.name,
-            },
+        sheet_sections, response = await asyncio.gather(
+            CharSheetSection.filter(
+                is_archived=False,
+                game_versions__contains=[GameVersion.V4.value],
+                character_classes__contains=[CharacterClass.VAMPIRE.value],
+            ).order_by("order"),
+            client.get(
+                build_url(CharacterBlueprints.SECTIONS, company_id=session_company.id),
+                headers=token_company_admin,
+                params={
+                    "game_version": GameVersion.V4.name,
+                    "character_class": CharacterClass.VAMPIRE.name,
+                },
+            ),
         )
         assert response.status_code == HTTP_200_OK
+        data = response.json()
 
-        assert len(response.json()["items"]) == len(sheet_sections)
-        assert response.json()["items"] == [
-            msgspec.json.decode(msgspec.json.encode(CharSheetSectionResponse.from_model(s)))
-            for s in sheet_sections
-        ]
+        assert len(data["items"]) == len(sheet_sections)
+        assert data["items"] == _to_json(
+            [CharSheetSectionResponse.from_model(s) for s in sheet_sections]
+        )
 
     async def test_get_sheet_section(
         self,
@@ -91,10 +145,10 @@ class TestSheetSection:
         token_company_admin: dict[str, str],
         session_company: Company,
         session_company_admin: Developer,
-        debug: Callable[[...], None],
+        seed_sheet_section: CharSheetSection,
     ) -> None:
         """Verify the get sheet section endpoint is working."""
-        sheet_section = await CharSheetSection.filter(is_archived=False).first()
+        sheet_section = seed_sheet_section
 
         response = await client.get(
             build_url(
@@ -106,9 +160,7 @@ class TestSheetSection:
         )
         assert response.status_code == HTTP_200_OK
 
-        assert response.json() == msgspec.json.decode(
-            msgspec.json.encode(CharSheetSectionResponse.from_model(sheet_section))
-        )
+        assert response.json() == _to_json(CharSheetSectionResponse.from_model(sheet_section))
 
 
 class TestSheetCategory:
@@ -121,17 +173,17 @@ class TestSheetCategory:
         token_company_admin: dict[str, str],
         session_company: Company,
         session_company_admin: Developer,
-        debug: Callable[[...], None],
+        seed_sheet_section: CharSheetSection,
     ) -> None:
         """Verify the get sheet category endpoint is working."""
-        sheet_section = await CharSheetSection.filter(is_archived=False).first()
+        sheet_section = seed_sheet_section
 
         trait_category = (
             await TraitCategory.filter(
                 is_archived=False,
                 sheet_section_id=sheet_section.id,
             )
-            .prefetch_related("sheet_section")
+            .select_related("sheet_section")
             .first()
         )
 
@@ -145,9 +197,7 @@ class TestSheetCategory:
         )
         assert response.status_code == HTTP_200_OK
 
-        assert response.json() == msgspec.json.decode(
-            msgspec.json.encode(TraitCategoryResponse.from_model(trait_category))
-        )
+        assert response.json() == _to_json(TraitCategoryResponse.from_model(trait_category))
 
     async def test_list_sheet_categories(
         self,
@@ -156,49 +206,39 @@ class TestSheetCategory:
         token_company_admin: dict[str, str],
         session_company: Company,
         session_company_admin: Developer,
-        debug: Callable[[...], None],
+        seed_sheet_section: CharSheetSection,
     ) -> None:
         """Verify the list sheet categories endpoint is working."""
-        sheet_section = await CharSheetSection.filter(is_archived=False).first()
+        sheet_section = seed_sheet_section
 
-        trait_categories = (
-            await TraitCategory.filter(
+        trait_categories, response = await asyncio.gather(
+            TraitCategory.filter(
                 is_archived=False,
                 sheet_section_id=sheet_section.id,
                 game_versions__contains=[GameVersion.V4.value],
                 character_classes__contains=[CharacterClass.VAMPIRE.value],
             )
             .order_by("order")
-            .prefetch_related("sheet_section")
-        )
-        # Verify a category with a different parent sheet section is not returned
-        different_category = (
-            await TraitCategory.filter(is_archived=False)
-            .exclude(sheet_section_id=sheet_section.id)
-            .prefetch_related("sheet_section")
-            .first()
-        )
-
-        response = await client.get(
-            build_url(CharacterBlueprints.CATEGORIES, company_id=session_company.id),
-            headers=token_company_admin,
-            params={
-                "game_version": GameVersion.V4.name,
-                "section_id": str(sheet_section.id),
-                "character_class": CharacterClass.VAMPIRE.name,
-            },
+            .select_related("sheet_section"),
+            client.get(
+                build_url(CharacterBlueprints.CATEGORIES, company_id=session_company.id),
+                headers=token_company_admin,
+                params={
+                    "game_version": GameVersion.V4.name,
+                    "section_id": str(sheet_section.id),
+                    "character_class": CharacterClass.VAMPIRE.name,
+                },
+            ),
         )
         assert response.status_code == HTTP_200_OK
+        data = response.json()
 
-        assert len(response.json()["items"]) == len(trait_categories)
-        assert response.json()["items"] == [
-            msgspec.json.decode(msgspec.json.encode(TraitCategoryResponse.from_model(tc)))
-            for tc in trait_categories
-        ]
-        different_expected = msgspec.json.decode(
-            msgspec.json.encode(TraitCategoryResponse.from_model(different_category))
+        assert len(data["items"]) == len(trait_categories)
+        assert data["items"] == _to_json(
+            [TraitCategoryResponse.from_model(tc) for tc in trait_categories]
         )
-        assert different_expected not in response.json()["items"]
+        # Categories with a different parent sheet section are not returned
+        assert all(item["sheet_section_id"] == str(sheet_section.id) for item in data["items"])
 
 
 class TestSheetSubcategory:
@@ -211,14 +251,16 @@ class TestSheetSubcategory:
         token_company_admin: dict[str, str],
         session_company: Company,
         session_company_admin: Developer,
-        debug: Callable[[...], None],
     ) -> None:
         """Verify the list category subcategories endpoint is working."""
         # Given a category with subcategories
         subcategory = (
-            await TraitSubcategory.filter(is_archived=False).exclude(category_id=None).first()
+            await TraitSubcategory.filter(is_archived=False)
+            .exclude(category_id=None)
+            .select_related("category")
+            .first()
         )
-        category = await TraitCategory.filter(id=subcategory.category_id).first()
+        category = subcategory.category
         game_version = category.game_versions[0]
 
         expected_count = await TraitSubcategory.filter(
@@ -239,9 +281,10 @@ class TestSheetSubcategory:
 
         # Then the response contains the expected subcategories
         assert response.status_code == HTTP_200_OK
-        assert response.json()["total"] == expected_count
-        assert len(response.json()["items"]) == min(10, expected_count)
-        for item in response.json()["items"]:
+        data = response.json()
+        assert data["total"] == expected_count
+        assert len(data["items"]) == min(10, expected_count)
+        for item in data["items"]:
             assert item["category_id"] == str(category.id)
 
     async def test_get_category_subcategory(
@@ -251,14 +294,13 @@ class TestSheetSubcategory:
         token_company_admin: dict[str, str],
         session_company: Company,
         session_company_admin: Developer,
-        debug: Callable[[...], None],
     ) -> None:
         """Verify the get category subcategory endpoint is working."""
         # Given a subcategory
         subcategory = (
             await TraitSubcategory.filter(is_archived=False)
             .exclude(category_id=None)
-            .prefetch_related("category", "sheet_section")
+            .select_related("category", "sheet_section")
             .first()
         )
 
@@ -274,9 +316,7 @@ class TestSheetSubcategory:
 
         # Then the response contains the expected subcategory
         assert response.status_code == HTTP_200_OK
-        assert response.json() == msgspec.json.decode(
-            msgspec.json.encode(TraitSubcategoryResponse.from_model(subcategory))
-        )
+        assert response.json() == _to_json(TraitSubcategoryResponse.from_model(subcategory))
 
 
 class TestSheetTrait:
@@ -291,7 +331,6 @@ class TestSheetTrait:
         session_company_admin: Developer,
         trait_factory: Callable[..., Awaitable[Trait]],
         trait_power_factory: Callable[..., Awaitable[TraitPower]],
-        debug: Callable[[...], None],
     ) -> None:
         """Verify the get sheet trait endpoint is working, including embedded powers."""
         # Use a dedicated trait so the power insert cannot contend with another test file
@@ -300,9 +339,10 @@ class TestSheetTrait:
         await trait_power_factory(trait=created, level=1, name="Integration Test Power")
         trait = (
             await Trait.filter(id=created.id)
-            .prefetch_related(
-                "category", "sheet_section", "subcategory", "gift_tribe", "gift_auspice", "powers"
+            .select_related(
+                "category", "sheet_section", "subcategory", "gift_tribe", "gift_auspice"
             )
+            .prefetch_related("powers")
             .first()
         )
 
@@ -315,13 +355,11 @@ class TestSheetTrait:
             headers=token_company_admin,
         )
         assert response.status_code == HTTP_200_OK
+        data = response.json()
 
-        assert response.json() == msgspec.json.decode(
-            msgspec.json.encode(TraitResponse.from_model(trait))
-        )
+        assert data == _to_json(TraitResponse.from_model(trait))
         assert any(
-            p["level"] == 1 and p["name"] == "Integration Test Power"
-            for p in response.json()["powers"]
+            p["level"] == 1 and p["name"] == "Integration Test Power" for p in data["powers"]
         )
 
     async def test_list_all_traits(
@@ -331,7 +369,6 @@ class TestSheetTrait:
         token_company_admin: dict[str, str],
         session_company: Company,
         session_company_admin: Developer,
-        debug: Callable[[...], None],
     ) -> None:
         """Verify the list all character sheet traits endpoint is working."""
         response = await client.get(
@@ -339,20 +376,19 @@ class TestSheetTrait:
             headers=token_company_admin,
         )
         assert response.status_code == HTTP_200_OK
+        data = response.json()
 
-        assert response.json()["total"] > 250
-        assert response.json()["limit"] == 10
-        assert response.json()["offset"] == 0
-        assert len(response.json()["items"]) == 10
-        first_alphabetical_trait = (
+        assert data["total"] > 250
+        assert data["limit"] == 10
+        assert data["offset"] == 0
+        assert len(data["items"]) == 10
+        first_alphabetical_trait_name = (
             await Trait.filter(is_archived=False)
             .order_by("name")
-            .prefetch_related(
-                "category", "sheet_section", "subcategory", "gift_tribe", "gift_auspice"
-            )
             .first()
+            .values_list("name", flat=True)
         )
-        assert response.json()["items"][0]["name"] == first_alphabetical_trait.name
+        assert data["items"][0]["name"] == first_alphabetical_trait_name
 
 
 class TestClassesConceptsAndSpecificOptions:
@@ -365,23 +401,25 @@ class TestClassesConceptsAndSpecificOptions:
         token_company_admin: dict[str, str],
         session_company: Company,
         session_company_admin: Developer,
-        debug: Callable[[...], None],
     ) -> None:
         """Verify the list concepts endpoint is working."""
         # When we list concepts
-        response = await client.get(
-            build_url(CharacterBlueprints.CONCEPTS, company_id=session_company.id),
-            headers=token_company_admin,
+        response, total, first_page = await asyncio.gather(
+            client.get(
+                build_url(CharacterBlueprints.CONCEPTS, company_id=session_company.id),
+                headers=token_company_admin,
+            ),
+            CharacterConcept.filter(is_archived=False).count(),
+            CharacterConcept.filter(is_archived=False).order_by("name").limit(10),
         )
 
         # Then verify the concepts were listed successfully
         assert response.status_code == HTTP_200_OK
-        concepts = await CharacterConcept.filter(is_archived=False).order_by("name")
-        assert response.json()["total"] == len(concepts)
-        assert response.json()["items"] == [
-            msgspec.json.decode(msgspec.json.encode(CharacterConceptResponse.from_model(c)))
-            for c in concepts[:10]
-        ]
+        data = response.json()
+        assert data["total"] == total
+        assert data["items"] == _to_json(
+            [CharacterConceptResponse.from_model(c) for c in first_page]
+        )
 
     async def test_get_concept(
         self,
@@ -390,10 +428,10 @@ class TestClassesConceptsAndSpecificOptions:
         token_company_admin: dict[str, str],
         session_company: Company,
         session_company_admin: Developer,
-        debug: Callable[[...], None],
+        seed_character_concept: CharacterConcept,
     ) -> None:
         """Verify the get concept endpoint is working."""
-        concept = await CharacterConcept.filter(is_archived=False).first()
+        concept = seed_character_concept
         response = await client.get(
             build_url(
                 CharacterBlueprints.CONCEPT_DETAIL,
@@ -403,184 +441,68 @@ class TestClassesConceptsAndSpecificOptions:
             headers=token_company_admin,
         )
         assert response.status_code == HTTP_200_OK
-        assert response.json() == msgspec.json.decode(
-            msgspec.json.encode(CharacterConceptResponse.from_model(concept))
-        )
+        assert response.json() == _to_json(CharacterConceptResponse.from_model(concept))
 
-    async def test_list_vampire_clans(
+    @pytest.mark.parametrize("option", _CLASS_OPTIONS, ids=lambda o: o.model.__name__)
+    async def test_list_class_options(
         self,
         client: AsyncClient,
         build_url: Callable[[str, ...], str],
         token_company_admin: dict[str, str],
         session_company: Company,
         session_company_admin: Developer,
-        debug: Callable[[...], None],
+        option: _ClassOption,
     ) -> None:
-        """Verify the list vampire clans endpoint is working."""
-        response = await client.get(
-            build_url(CharacterBlueprints.VAMPIRE_CLANS, company_id=session_company.id),
-            headers=token_company_admin,
-        )
-        vampire_clans = (
-            await VampireClan.filter(is_archived=False)
-            .order_by("name")
-            .prefetch_related("disciplines")
-        )
-
-        assert response.status_code == HTTP_200_OK
-        assert response.json()["total"] == len(vampire_clans)
-        assert _sort_id_lists(response.json()["items"], "discipline_ids") == _sort_id_lists(
-            [
-                msgspec.json.decode(msgspec.json.encode(VampireClanResponse.from_model(vc)))
-                for vc in vampire_clans[:10]
-            ],
-            "discipline_ids",
-        )
-
-    async def test_get_vampire_clan(
-        self,
-        client: AsyncClient,
-        build_url: Callable[[str, ...], str],
-        token_company_admin: dict[str, str],
-        session_company: Company,
-        session_company_admin: Developer,
-        debug: Callable[[...], None],
-    ) -> None:
-        """Verify the get vampire clan endpoint is working."""
-        vampire_clan = (
-            await VampireClan.filter(is_archived=False).prefetch_related("disciplines").first()
-        )
-        response = await client.get(
-            build_url(
-                CharacterBlueprints.VAMPIRE_CLAN_DETAIL,
-                company_id=session_company.id,
-                vampire_clan_id=vampire_clan.id,
+        """Verify the list endpoints for class-specific options are working."""
+        response, total, first_page = await asyncio.gather(
+            client.get(
+                build_url(option.list_url, company_id=session_company.id),
+                headers=token_company_admin,
             ),
-            headers=token_company_admin,
-        )
-        assert response.status_code == HTTP_200_OK
-        data = response.json()
-        expected = msgspec.json.decode(
-            msgspec.json.encode(VampireClanResponse.from_model(vampire_clan))
-        )
-        data["discipline_ids"] = sorted(data["discipline_ids"])
-        expected["discipline_ids"] = sorted(expected["discipline_ids"])
-        assert data == expected
-
-    async def test_list_werewolf_tribes(
-        self,
-        client: AsyncClient,
-        build_url: Callable[[str, ...], str],
-        token_company_admin: dict[str, str],
-        session_company: Company,
-        session_company_admin: Developer,
-        debug: Callable[[...], None],
-    ) -> None:
-        """Verify the list werewolf tribes endpoint is working."""
-        response = await client.get(
-            build_url(CharacterBlueprints.WEREWOLF_TRIBES, company_id=session_company.id),
-            headers=token_company_admin,
-        )
-        werewolf_tribes = (
-            await WerewolfTribe.filter(is_archived=False).order_by("name").prefetch_related("gifts")
-        )
-
-        assert response.status_code == HTTP_200_OK
-        assert response.json()["total"] == len(werewolf_tribes)
-        assert _sort_id_lists(response.json()["items"], "gift_trait_ids") == _sort_id_lists(
-            [
-                msgspec.json.decode(msgspec.json.encode(WerewolfTribeResponse.from_model(wt)))
-                for wt in werewolf_tribes[:10]
-            ],
-            "gift_trait_ids",
-        )
-
-    async def test_get_werewolf_tribe(
-        self,
-        client: AsyncClient,
-        build_url: Callable[[str, ...], str],
-        token_company_admin: dict[str, str],
-        session_company: Company,
-        session_company_admin: Developer,
-        debug: Callable[[...], None],
-    ) -> None:
-        """Verify the get werewolf tribe endpoint is working."""
-        werewolf_tribe = (
-            await WerewolfTribe.filter(is_archived=False).prefetch_related("gifts").first()
-        )
-        response = await client.get(
-            build_url(
-                CharacterBlueprints.WEREWOLF_TRIBE_DETAIL,
-                company_id=session_company.id,
-                werewolf_tribe_id=werewolf_tribe.id,
-            ),
-            headers=token_company_admin,
-        )
-        assert response.status_code == HTTP_200_OK
-        data = response.json()
-        expected = msgspec.json.decode(
-            msgspec.json.encode(WerewolfTribeResponse.from_model(werewolf_tribe))
-        )
-        data["gift_trait_ids"] = sorted(data["gift_trait_ids"])
-        expected["gift_trait_ids"] = sorted(expected["gift_trait_ids"])
-        assert data == expected
-
-    async def test_list_werewolf_auspices(
-        self,
-        client: AsyncClient,
-        build_url: Callable[[str, ...], str],
-        token_company_admin: dict[str, str],
-        session_company: Company,
-        session_company_admin: Developer,
-        debug: Callable[[...], None],
-    ) -> None:
-        """Verify the list werewolf auspices endpoint is working."""
-        response = await client.get(
-            build_url(CharacterBlueprints.WEREWOLF_AUSPICES, company_id=session_company.id),
-            headers=token_company_admin,
-        )
-        werewolf_auspices = (
-            await WerewolfAuspice.filter(is_archived=False)
+            option.model.filter(is_archived=False).count(),
+            option.model.filter(is_archived=False)
             .order_by("name")
-            .prefetch_related("gifts")
+            .limit(10)
+            .prefetch_related(option.related),
         )
 
         assert response.status_code == HTTP_200_OK
-        assert response.json()["total"] == len(werewolf_auspices)
-        assert _sort_id_lists(response.json()["items"], "gift_trait_ids") == _sort_id_lists(
-            [
-                msgspec.json.decode(msgspec.json.encode(WerewolfAuspiceResponse.from_model(wa)))
-                for wa in werewolf_auspices[:10]
-            ],
-            "gift_trait_ids",
+        data = response.json()
+        assert data["total"] == total
+        assert _sort_id_lists(data["items"], option.ids_key) == _sort_id_lists(
+            _to_json([option.response.from_model(m) for m in first_page]),
+            option.ids_key,
         )
 
-    async def test_get_werewolf_auspice(
+    @pytest.mark.parametrize("option", _CLASS_OPTIONS, ids=lambda o: o.model.__name__)
+    async def test_get_class_option(
         self,
         client: AsyncClient,
         build_url: Callable[[str, ...], str],
         token_company_admin: dict[str, str],
         session_company: Company,
         session_company_admin: Developer,
-        debug: Callable[[...], None],
+        seed_vampire_clan: VampireClan,
+        seed_werewolf_tribe: WerewolfTribe,
+        seed_werewolf_auspice: WerewolfAuspice,
+        option: _ClassOption,
     ) -> None:
-        """Verify the get werewolf auspice endpoint is working."""
-        werewolf_auspice = (
-            await WerewolfAuspice.filter(is_archived=False).prefetch_related("gifts").first()
-        )
+        """Verify the detail endpoints for class-specific options are working."""
+        model = {
+            VampireClan: seed_vampire_clan,
+            WerewolfTribe: seed_werewolf_tribe,
+            WerewolfAuspice: seed_werewolf_auspice,
+        }[option.model]
         response = await client.get(
             build_url(
-                CharacterBlueprints.WEREWOLF_AUSPICE_DETAIL,
+                option.detail_url,
                 company_id=session_company.id,
-                werewolf_auspice_id=werewolf_auspice.id,
+                **{option.id_param: model.id},
             ),
             headers=token_company_admin,
         )
         assert response.status_code == HTTP_200_OK
-        data = response.json()
-        expected = msgspec.json.decode(
-            msgspec.json.encode(WerewolfAuspiceResponse.from_model(werewolf_auspice))
+        expected = _to_json(option.response.from_model(model))
+        assert _sort_id_lists([response.json()], option.ids_key) == _sort_id_lists(
+            [expected], option.ids_key
         )
-        data["gift_trait_ids"] = sorted(data["gift_trait_ids"])
-        expected["gift_trait_ids"] = sorted(expected["gift_trait_ids"])
-        assert data == expected
@@ -5,7 +5,6 @@ from __future__ import annotations
 from datetime import timedelta
 from typing import TYPE_CHECKING, Any
 from unittest.mock import ANY, AsyncMock, patch
-from uuid import uuid4
 
 import pytest
 from litestar.status_codes import (
@@ -17,8 +16,6 @@ from litestar.status_codes import (
 
 from vapi.constants import CharacterClass, CharacterType
 from vapi.db.sql_models.character import Character
-from vapi.db.sql_models.character_classes import VampireClan, WerewolfAuspice, WerewolfTribe
-from vapi.db.sql_models.character_concept import CharacterConcept
 from vapi.db.sql_models.chargen_session import ChargenSession
 from vapi.db.sql_models.company import CompanySettings
 from vapi.domain.handlers.character_autogeneration.constants import (
@@ -31,22 +28,52 @@ from vapi.domain.urls import Characters as CharacterURL
 from vapi.utils.time import time_now
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Awaitable, Callable
 
-    from httpx import AsyncClient
+    from httpx import AsyncClient, Response
 
     from vapi.db.sql_models.campaign import Campaign
+    from vapi.db.sql_models.character_classes import VampireClan, WerewolfAuspice, WerewolfTribe
+    from vapi.db.sql_models.character_concept import CharacterConcept
     from vapi.db.sql_models.company import Company
     from vapi.db.sql_models.user import User
 
 pytestmark = pytest.mark.anyio
 
-EXCLUDE_CHARACTER_FIELDS = {
-    "archive_date",
-    "is_archived",
-    "is_temporary",
-    "is_chargen",
-}
+# A well-formed id that never belongs to a stored row
+_NONEXISTENT_ID = "00000000-0000-0000-0000-000000000000"
+
+
+@pytest.fixture
+def start_chargen(
+    client: AsyncClient,
+    build_url: Callable[[str, Any], str],
+    token_global_admin: dict[str, str],
+    session_company: Company,
+    session_user: User,
+    session_campaign: Campaign,
+) -> Callable[..., Awaitable[Response]]:
+    """Return a helper that starts a chargen session for the session user.
+
+    The helper applies the given autogen settings to the session company, grants the
+    user enough XP to pay for chargen, and returns the start chargen response.
+    """
+
+    async def _start_chargen(num_choices: int, **company_settings: Any) -> Response:
+        await CompanySettings.filter(company=session_company).update(
+            character_autogen_num_choices=num_choices, **company_settings
+        )
+        await UserXPService().add_xp(session_user.id, session_campaign.id, 100)
+        return await client.post(
+            build_url(
+                CharacterURL.CHARGEN_START,
+                company_id=session_company.id,
+            ),
+            headers=token_global_admin | {"On-Behalf-Of": str(session_user.id)},
+            params={"campaign_id": str(session_campaign.id)},
+        )
+
+    return _start_chargen
 
 
 class TestAutogenerateCharacter:
@@ -84,14 +111,18 @@ class TestAutogenerateCharacter:
         session_global_admin: Any,
         session_user_storyteller: User,
         session_campaign: Campaign,
+        seed_character_concept: CharacterConcept,
+        seed_vampire_clan: VampireClan,
+        seed_werewolf_tribe: WerewolfTribe,
+        seed_werewolf_auspice: WerewolfAuspice,
         debug: Callable[[Any], None],
         mocker: Any,
     ) -> None:
         """Verify autogenerate character endpoint."""
-        concept = await CharacterConcept.filter(is_archived=False).first()
-        clan = await VampireClan.filter(is_archived=False, game_versions__contains=["V5"]).first()
-        tribe = await WerewolfTribe.filter(is_archived=False).first()
-        auspice = await WerewolfAuspice.filter(is_archived=False).first()
+        concept = seed_character_concept
+        clan = seed_vampire_clan
+        tribe = seed_werewolf_tribe
+        auspice = seed_werewolf_auspice
         spy1 = mocker.spy(GetModelByIdValidationService, "get_concept_by_id")
         spy2 = mocker.spy(GetModelByIdValidationService, "get_vampire_clan_by_id")
         spy3 = mocker.spy(GetModelByIdValidationService, "get_werewolf_tribe_by_id")
@@ -150,40 +181,20 @@ class TestCharacterChargen:
     )
     async def test_start_chargen_with_character_autogen_num_choices(
         self,
-        client: AsyncClient,
-        build_url: Callable[[str, Any], str],
-        token_global_admin: dict[str, str],
-        session_company: Company,
-        session_global_admin: Any,
-        session_user: User,
-        session_campaign: Campaign,
+        start_chargen: Callable[..., Awaitable[Response]],
         character_autogen_num_choices: int,
-        debug: Callable[[Any], None],
     ) -> None:
         """Verify start chargen endpoint."""
-        # Given a company and user with the correct settings
-        await CompanySettings.filter(company=session_company).update(
-            character_autogen_num_choices=character_autogen_num_choices
-        )
-
-        await UserXPService().add_xp(session_user.id, session_campaign.id, 100)
-
-        # When we start chargen
-        response = await client.post(
-            build_url(
-                CharacterURL.CHARGEN_START,
-                company_id=session_company.id,
-            ),
-            headers=token_global_admin | {"On-Behalf-Of": str(session_user.id)},
-            params={"campaign_id": str(session_campaign.id)},
-        )
+        # When we start chargen with the company set to the given number of choices
+        response = await start_chargen(num_choices=character_autogen_num_choices)
         # debug(response.json())
 
         # Then we should get a 201 created response and the characters should be temporary and have the correct chargen session id
         assert response.status_code == HTTP_201_CREATED
-        assert response.json()["requires_selection"] == (character_autogen_num_choices > 1)
+        data = response.json()
+        assert data["requires_selection"] == (character_autogen_num_choices > 1)
 
-        characters = response.json()["characters"]
+        characters = data["characters"]
         assert len(characters) == character_autogen_num_choices
         for character in characters:
             assert character["is_temporary"] == (character_autogen_num_choices > 1)
@@ -226,29 +237,17 @@ class TestCharacterChargen:
         build_url: Callable[[str, Any], str],
         token_global_admin: dict[str, str],
         session_company: Company,
-        session_global_admin: Any,
         session_user: User,
-        session_campaign: Campaign,
+        start_chargen: Callable[..., Awaitable[Response]],
     ) -> None:
         """Verify finalize chargen endpoint."""
         # Given a chargen session with 3 characters and a configured starting_points budget
-        await CompanySettings.filter(company=session_company).update(
-            character_autogen_num_choices=3,
-            character_autogen_starting_points=42,
-        )
-        await UserXPService().add_xp(session_user.id, session_campaign.id, 100)
-        response = await client.post(
-            build_url(
-                CharacterURL.CHARGEN_START,
-                company_id=session_company.id,
-            ),
-            headers=token_global_admin | {"On-Behalf-Of": str(session_user.id)},
-            params={"campaign_id": str(session_campaign.id)},
-        )
-        chargen_session_id = response.json()["id"]
-        characters = response.json()["characters"]
+        response = await start_chargen(num_choices=3, character_autogen_starting_points=42)
+        start_data = response.json()
+        chargen_session_id = start_data["id"]
+        characters = start_data["characters"]
         assert len(characters) == 3
-        selected_character_id = characters[0]["id"]
+        selected_character_id, *other_character_ids = (c["id"] for c in characters)
 
         # When we finalize the chargen
         response = await client.post(
@@ -264,103 +263,53 @@ class TestCharacterChargen:
         # Then we should return the selected character and delete the other characters
         assert response.status_code == HTTP_201_CREATED
         assert response.json()["id"] == selected_character_id
+        assert not await Character.filter(id__in=other_character_ids).exists()
 
-        for character_id in [character["id"] for character in characters]:
-            c = await Character.filter(id=character_id).first()
-            if character_id != selected_character_id:
-                assert c is None
-            else:
-                assert c is not None
-                assert c.is_temporary is False
-                assert c.is_chargen is False
-                assert c.is_archived is False
-                # And the selected character inherits the company's starting_points setting
-                assert c.starting_points == 42
-
-    async def test_finalize_chargen_invalid_session_id(
-        self,
-        client: AsyncClient,
-        build_url: Callable[[str, Any], str],
-        token_global_admin: dict[str, str],
-        session_company: Company,
-        session_global_admin: Any,
-        session_user: User,
-        session_campaign: Campaign,
-    ) -> None:
-        """Verify finalize chargen endpoint with invalid session id."""
-        # Given a chargen session with 3 characters
-        await CompanySettings.filter(company=session_company).update(
-            character_autogen_num_choices=3
-        )
-        await UserXPService().add_xp(session_user.id, session_campaign.id, 100)
-        response = await client.post(
-            build_url(
-                CharacterURL.CHARGEN_START,
-                company_id=session_company.id,
-            ),
-            headers=token_global_admin | {"On-Behalf-Of": str(session_user.id)},
-            params={"campaign_id": str(session_campaign.id)},
-        )
-        characters = response.json()["characters"]
-        assert len(characters) == 3
-        selected_character_id = characters[0]["id"]
+        selected_character = await Character.get_or_none(id=selected_character_id)
+        assert selected_character is not None
+        assert selected_character.is_temporary is False
+        assert selected_character.is_chargen is False
+        assert selected_character.is_archived is False
+        # And the selected character inherits the company's starting_points setting
+        assert selected_character.starting_points == 42
 
-        # When we finalize the chargen with an invalid session id
-        response = await client.post(
-            build_url(
-                CharacterURL.CHARGEN_FINALIZE,
-                company_id=session_company.id,
-            ),
-            headers=token_global_admin | {"On-Behalf-Of": str(session_user.id)},
-            json={
-                "session_id": "invalid-session-id",
-                "selected_character_id": selected_character_id,
-            },
-        )
-        # debug(response.json())
-
-        # Then we should get a 400 bad request response
-        assert response.status_code == HTTP_400_BAD_REQUEST
-
-    async def test_finalize_chargen_invalid_selected_character_id(
+    @pytest.mark.parametrize(
+        "override",
+        [
+            {"session_id": "invalid-session-id"},
+            {"selected_character_id": _NONEXISTENT_ID},
+        ],
+        ids=["invalid_session_id", "invalid_selected_character_id"],
+    )
+    async def test_finalize_chargen_invalid_payload(
         self,
         client: AsyncClient,
         build_url: Callable[[str, Any], str],
         token_global_admin: dict[str, str],
         session_company: Company,
-        session_global_admin: Any,
         session_user: User,
-        session_campaign: Campaign,
+        start_chargen: Callable[..., Awaitable[Response]],
+        override: dict[str, str],
     ) -> None:
-        """Verify finalize chargen endpoint with invalid selected character id."""
+        """Verify finalize chargen endpoint rejects an invalid session or selected character id."""
         # Given a chargen session with 3 characters
-        await CompanySettings.filter(company=session_company).update(
-            character_autogen_num_choices=3
-        )
-        await UserXPService().add_xp(session_user.id, session_campaign.id, 100)
-        response = await client.post(
-            build_url(
-                CharacterURL.CHARGEN_START,
-                company_id=session_company.id,
-            ),
-            headers=token_global_admin | {"On-Behalf-Of": str(session_user.id)},
-            params={"campaign_id": str(session_campaign.id)},
-        )
-        chargen_session_id = response.json()["id"]
-        characters = response.json()["characters"]
+        response = await start_chargen(num_choices=3)
+        start_data = response.json()
+        characters = start_data["characters"]
         assert len(characters) == 3
+        payload = {
+            "session_id": start_data["id"],
+            "selected_character_id": characters[0]["id"],
+        }
 
-        # When we finalize the chargen with an invalid selected character id
+        # When we finalize the chargen with one invalid id
         response = await client.post(
             build_url(
                 CharacterURL.CHARGEN_FINALIZE,
                 company_id=session_company.id,
             ),
             headers=token_global_admin | {"On-Behalf-Of": str(session_user.id)},
-            json={
-                "session_id": chargen_session_id,
-                "selected_character_id": str(uuid4()),
-            },
+            json=payload | override,
         )
         # debug(response.json())
 
@@ -377,24 +326,12 @@ class TestChargenSessions:
         build_url: Callable[[str, Any], str],
         token_global_admin: dict[str, str],
         session_company: Company,
-        session_global_admin: Any,
         session_user: User,
-        session_campaign: Campaign,
+        start_chargen: Callable[..., Awaitable[Response]],
     ) -> None:
         """Verify listing active chargen sessions returns sessions with characters."""
         # Given a chargen session exists
-        await CompanySettings.filter(company=session_company).update(
-            character_autogen_num_choices=2
-        )
-        await UserXPService().add_xp(session_user.id, session_campaign.id, 100)
-        start_response = await client.post(
-            build_url(
-                CharacterURL.CHARGEN_START,
-                company_id=session_company.id,
-            ),
-            headers=token_global_admin | {"On-Behalf-Of": str(session_user.id)},
-            params={"campaign_id": str(session_campaign.id)},
-        )
+        start_response = await start_chargen(num_choices=2)
         assert start_response.status_code == HTTP_201_CREATED
         session_id = start_response.json()["id"]
 
@@ -422,24 +359,12 @@ class TestChargenSessions:
         build_url: Callable[[str, Any], str],
         token_global_admin: dict[str, str],
         session_company: Company,
-        session_global_admin: Any,
         session_user: User,
-        session_campaign: Campaign,
+        start_chargen: Callable[..., Awaitable[Response]],
     ) -> None:
         """Verify expired sessions are excluded from the list."""
         # Given an expired chargen session
-        await CompanySettings.filter(company=session_company).update(
-            character_autogen_num_choices=1
-        )
-        await UserXPService().add_xp(session_user.id, session_campaign.id, 100)
-        start_response = await client.post(
-            build_url(
-                CharacterURL.CHARGEN_START,
-                company_id=session_company.id,
-            ),
-            headers=token_global_admin | {"On-Behalf-Of": str(session_user.id)},
-            params={"campaign_id": str(session_campaign.id)},
-        )
+        start_response = await start_chargen(num_choices=1)
         assert start_response.status_code == HTTP_201_CREATED
         session_id = start_response.json()["id"]
 
@@ -469,25 +394,14 @@ class TestChargenSessions:
         build_url: Callable[[str, Any], str],
         token_global_admin: dict[str, str],
         session_company: Company,
-        session_global_admin: Any,
         session_user: User,
         session_campaign: Campaign,
+        start_chargen: Callable[..., Awaitable[Response]],
         user_factory: Any,
     ) -> None:
         """Verify sessions from other users are not visible."""
         # Given a chargen session for base_user
-        await CompanySettings.filter(company=session_company).update(
-            character_autogen_num_choices=1
-        )
-        await UserXPService().add_xp(session_user.id, session_campaign.id, 100)
-        start_response = await client.post(
-            build_url(
-                CharacterURL.CHARGEN_START,
-                company_id=session_company.id,
-            ),
-            headers=token_global_admin | {"On-Behalf-Of": str(session_user.id)},
-            params={"campaign_id": str(session_campaign.id)},
-        )
+        start_response = await start_chargen(num_choices=1)
         assert start_response.status_code == HTTP_201_CREATED
 
         # Create a fake session for a different user
@@ -523,24 +437,12 @@ class TestChargenSessions:
         build_url: Callable[[str, Any], str],
         token_global_admin: dict[str, str],
         session_company: Company,
-        session_global_admin: Any,
         session_user: User,
-        session_campaign: Campaign,
+        start_chargen: Callable[..., Awaitable[Response]],
     ) -> None:
         """Verify retrieving a session by ID returns the session with characters."""
         # Given a chargen session
-        await CompanySettings.filter(company=session_company).update(
-            character_autogen_num_choices=2
-        )
-        await UserXPService().add_xp(session_user.id, session_campaign.id, 100)
-        start_response = await client.post(
-            build_url(
-                CharacterURL.CHARGEN_START,
-                company_id=session_company.id,
-            ),
-            headers=token_global_admin | {"On-Behalf-Of": str(session_user.id)},
-            params={"campaign_id": str(session_campaign.id)},
-        )
+        start_response = await start_chargen(num_choices=2)
         assert start_response.status_code == HTTP_201_CREATED
         session_id = start_response.json()["id"]
 
@@ -556,9 +458,10 @@ class TestChargenSessions:
 
         # Then the session is returned with characters
         assert response.status_code == HTTP_200_OK
-        assert response.json()["id"] == session_id
-        assert len(response.json()["characters"]) == 2
-        assert response.json()["requires_selection"] is True
+        data = response.json()
+        assert data["id"] == session_id
+        assert len(data["characters"]) == 2
+        assert data["requires_selection"] is True
 
     async def test_get_chargen_session_not_found(
         self,
@@ -576,7 +479,7 @@ class TestChargenSessions:
             build_url(
                 CharacterURL.CHARGEN_SESSION_DETAIL,
                 company_id=session_company.id,
-                session_id=str(uuid4()),
+                session_id=_NONEXISTENT_ID,
             ),
             headers=token_global_admin | {"On-Behalf-Of": str(session_user.id)},
         )
@@ -590,24 +493,12 @@ class TestChargenSessions:
         build_url: Callable[[str, Any], str],
         token_global_admin: dict[str, str],
         session_company: Company,
-        session_global_admin: Any,
         session_user: User,
-        session_campaign: Campaign,
+        start_chargen: Callable[..., Awaitable[Response]],
     ) -> None:
         """Verify getting an expired session returns an error."""
         # Given an expired session
-        await CompanySettings.filter(company=session_company).update(
-            character_autogen_num_choices=1
-        )
-        await UserXPService().add_xp(session_user.id, session_campaign.id, 100)
-        start_response = await client.post(
-            build_url(
-                CharacterURL.CHARGEN_START,
-                company_id=session_company.id,
-            ),
-            headers=token_global_admin | {"On-Behalf-Of": str(session_user.id)},
-            params={"campaign_id": str(session_campaign.id)},
-        )
+        start_response = await start_chargen(num_choices=1)
         assert start_response.status_code == HTTP_201_CREATED
         session_id = start_response.json()["id"]
 
@@ -631,30 +522,14 @@ class TestChargenSessions:
 
     async def test_start_chargen_creates_session_document(
         self,
-        client: AsyncClient,
-        build_url: Callable[[str, Any], str],
-        token_global_admin: dict[str, str],
         session_company: Company,
-        session_global_admin: Any,
         session_user: User,
         session_campaign: Campaign,
+        start_chargen: Callable[..., Awaitable[Response]],
     ) -> None:
         """Verify starting chargen creates a ChargenSession in the database."""
-        # Given
-        await CompanySettings.filter(company=session_company).update(
-            character_autogen_num_choices=1
-        )
-        await UserXPService().add_xp(session_user.id, session_campaign.id, 100)
-
         # When starting chargen
-        response = await client.post(
-            build_url(
-                CharacterURL.CHARGEN_START,
-                company_id=session_company.id,
-            ),
-            headers=token_global_admin | {"On-Behalf-Of": str(session_user.id)},
-            params={"campaign_id": str(session_campaign.id)},
-        )
+        response = await start_chargen(num_choices=1)
 
         # Then a ChargenSession document exists
         assert response.status_code == HTTP_201_CREATED
@@ -671,27 +546,16 @@ class TestChargenSessions:
         build_url: Callable[[str, Any], str],
         token_global_admin: dict[str, str],
         session_company: Company,
-        session_global_admin: Any,
         session_user: User,
-        session_campaign: Campaign,
+        start_chargen: Callable[..., Awaitable[Response]],
     ) -> None:
         """Verify finalizing chargen deletes the ChargenSession document."""
         # Given a chargen session with 3 characters
-        await CompanySettings.filter(company=session_company).update(
-            character_autogen_num_choices=3
-        )
-        await UserXPService().add_xp(session_user.id, session_campaign.id, 100)
-        start_response = await client.post(
-            build_url(
-                CharacterURL.CHARGEN_START,
-                company_id=session_company.id,
-            ),
-            headers=token_global_admin | {"On-Behalf-Of": str(session_user.id)},
-            params={"campaign_id": str(session_campaign.id)},
-        )
+        start_response = await start_chargen(num_choices=3)
         assert start_response.status_code == HTTP_201_CREATED
-        session_id = start_response.json()["id"]
-        characters = start_response.json()["characters"]
+        start_data = start_response.json()
+        session_id = start_data["id"]
+        characters = start_data["characters"]
         selected_character_id = characters[0]["id"]
 
         # When finalizing
@@ -711,33 +575,17 @@ class TestChargenSessions:
 
     async def test_scheduled_task_cleans_expired_sessions(
         self,
-        client: AsyncClient,
-        build_url: Callable[[str, Any], str],
-        token_global_admin: dict[str, str],
-        session_company: Company,
-        session_global_admin: Any,
-        session_user: User,
-        session_campaign: Campaign,
+        start_chargen: Callable[..., Awaitable[Response]],
     ) -> None:
         """Verify the scheduled task deletes expired sessions and their characters."""
         from vapi.lib.scheduled_tasks import purge_db_expired_items
 
         # Given an expired chargen session with characters
-        await CompanySettings.filter(company=session_company).update(
-            character_autogen_num_choices=2
-        )
-        await UserXPService().add_xp(session_user.id, session_campaign.id, 100)
-        start_response = await client.post(
-            build_url(
-                CharacterURL.CHARGEN_START,
-                company_id=session_company.id,
-            ),
-            headers=token_global_admin | {"On-Behalf-Of": str(session_user.id)},
-            params={"campaign_id": str(session_campaign.id)},
-        )
+        start_response = await start_chargen(num_choices=2)
         assert start_response.status_code == HTTP_201_CREATED
-        session_id = start_response.json()["id"]
-        character_ids = [c["id"] for c in start_response.json()["characters"]]
+        start_data = start_response.json()
+        session_id = start_data["id"]
+        character_ids = [c["id"] for c in start_data["characters"]]
 
         # Expire the session
         await ChargenSession.filter(id=session_id).update(
@@ -754,6 +602,4 @@ class TestChargenSessions:
         # Then the session and its characters are deleted
         session = await ChargenSession.filter(id=session_id).first()
         assert session is None
-        for character_id in character_ids:
-            c = await Character.filter(id=character_id).first()
-            assert c is None
+        assert not await Character.filter(id__in=character_ids).exists()
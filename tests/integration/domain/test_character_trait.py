@@ -1,5 +1,6 @@
 """Test character trait controllers."""
 
+import asyncio
 from collections.abc import Callable
 from typing import Any
 from uuid import uuid4
@@ -33,6 +34,21 @@ from vapi.domain.urls import Characters
 pytestmark = pytest.mark.anyio
 
 
+@pytest.fixture(scope="module")
+def session_users_by_role(
+    session_user: User, session_user_storyteller: User, session_user_admin: User
+) -> dict[UserRole, User]:
+    """Map each user role to the session-scoped user that holds it.
+
+    Role-parametrized tests act as these users instead of creating one per case.
+    """
+    return {
+        UserRole.PLAYER: session_user,
+        UserRole.STORYTELLER: session_user_storyteller,
+        UserRole.ADMIN: session_user_admin,
+    }
+
+
 class TestFetchingCharacterTraits:
     """Test fetching character traits."""
 
@@ -58,11 +74,14 @@ class TestFetchingCharacterTraits:
             campaign=session_campaign,
         )
         trait_categories = await TraitCategory.filter(is_archived=False)
-        trait1 = await trait_factory(category=trait_categories[0])
-        trait2 = await trait_factory(category=trait_categories[1])
-
-        character_trait1 = await character_trait_factory(character=character, trait=trait1)
-        await character_trait_factory(character=character, trait=trait2)
+        trait1, trait2 = await asyncio.gather(
+            trait_factory(category=trait_categories[0]),
+            trait_factory(category=trait_categories[1]),
+        )
+        character_trait1, _ = await asyncio.gather(
+            character_trait_factory(character=character, trait=trait1),
+            character_trait_factory(character=character, trait=trait2),
+        )
 
         response = await client.get(
             build_url(
@@ -74,10 +93,11 @@ class TestFetchingCharacterTraits:
             params={"category_id": str(trait_categories[0].id)},
         )
         assert response.status_code == HTTP_200_OK
-        assert response.json()["total"] == 1
-        assert response.json()["limit"] == 10
-        assert response.json()["offset"] == 0
-        items = response.json()["items"]
+        data = response.json()
+        assert data["total"] == 1
+        assert data["limit"] == 10
+        assert data["offset"] == 0
+        items = data["items"]
         assert len(items) == 1
         assert items[0]["id"] == str(character_trait1.id)
         assert items[0]["value"] == character_trait1.value
@@ -94,6 +114,7 @@ class TestFetchingCharacterTraits:
         character_trait_factory: Callable[..., CharacterTrait],
         token_global_admin: dict[str, str],
         on_behalf_of_header: dict[str, str],
+        seed_trait: Trait,
     ) -> None:
         """Verify getting a single character trait by ID."""
         character = await character_factory(
@@ -102,8 +123,7 @@ class TestFetchingCharacterTraits:
             user_creator=session_user,
             campaign=session_campaign,
         )
-        trait = await Trait.filter(is_archived=False).first()
-        character_trait = await character_trait_factory(character=character, trait=trait)
+        character_trait = await character_trait_factory(character=character, trait=seed_trait)
 
         response = await client.get(
             build_url(
@@ -115,11 +135,12 @@ class TestFetchingCharacterTraits:
             headers=token_global_admin | on_behalf_of_header,
         )
         assert response.status_code == HTTP_200_OK
-        assert response.json()["id"] == str(character_trait.id)
-        assert response.json()["character_id"] == str(character.id)
-        assert response.json()["value"] == character_trait.value
-        assert "trait" in response.json()
-        assert response.json()["trait"]["id"] == str(trait.id)
+        data = response.json()
+        assert data["id"] == str(character_trait.id)
+        assert data["character_id"] == str(character.id)
+        assert data["value"] == character_trait.value
+        assert "trait" in data
+        assert data["trait"]["id"] == str(seed_trait.id)
 
     async def test_get_character_trait_not_found(
         self,
@@ -201,25 +222,21 @@ class TestAddConstantTraitToCharacter:
 
         # Then the response is correct and the trait is added
         assert response.status_code == HTTP_201_CREATED
-        character_trait_id = response.json()["id"]
-        assert response.json()["value"] == 1
-        assert response.json()["character_id"] == str(character.id)
-        assert response.json()["trait"]["id"] == str(trait.id)
-        assert response.json()["trait"]["max_value"] == trait.max_value
+        data = response.json()
+        character_trait_id = data["id"]
+        assert data["value"] == 1
+        assert data["character_id"] == str(character.id)
+        assert data["trait"]["id"] == str(trait.id)
+        assert data["trait"]["max_value"] == trait.max_value
 
         # Verify persisted in DB
-        ct = (
-            await CharacterTrait.filter(id=character_trait_id)
-            .prefetch_related(
-                "trait", "trait__category", "trait__subcategory", "trait__sheet_section"
-            )
-            .first()
-        )
-        assert ct is not None
-        assert ct.value == 1
-        assert ct.trait_id == trait.id
-        assert ct.character_id == character.id
-        assert not ct.trait.custom_for_character_id
+        value, trait_id, character_id, custom_for_character_id = await CharacterTrait.get(
+            id=character_trait_id
+        ).values_list("value", "trait_id", "character_id", "trait__custom_for_character_id")
+        assert value == 1
+        assert trait_id == trait.id
+        assert character_id == character.id
+        assert not custom_for_character_id
 
         character_trait_spy.assert_called_once()
 
@@ -272,8 +289,9 @@ class TestAssignTraitAffordability:
         assert "XP" in response.json()["detail"]
 
         # Then no orphaned CharacterTrait is created
-        orphan = await CharacterTrait.filter(character_id=character.id, trait_id=trait.id).first()
-        assert orphan is None
+        assert not await CharacterTrait.filter(
+            character_id=character.id, trait_id=trait.id
+        ).exists()
 
 
 class TestCustomTraits:
@@ -323,13 +341,7 @@ class TestCustomTraits:
         assert response.status_code == HTTP_201_CREATED
 
         created_custom_trait_id = response.json()["id"]
-        ct = (
-            await CharacterTrait.filter(id=created_custom_trait_id)
-            .prefetch_related(
-                "trait", "trait__category", "trait__subcategory", "trait__sheet_section"
-            )
-            .first()
-        )
+        ct = await CharacterTrait.filter(id=created_custom_trait_id).select_related("trait").first()
         assert ct is not None
         # New custom traits always start at value 1
         assert ct.value == 1
@@ -339,10 +351,6 @@ class TestCustomTraits:
         assert ct.trait.name == "Test Trait"
         assert ct.trait.description == "Test Description"
 
-        # Clean up the custom trait since it lives in the constant trait table
-        # and won't be removed by per-test cleanup
-        await ct.trait.delete()
-
     async def test_create_custom_player_pays_xp_when_free_changes_restricted(
         self,
         client: AsyncClient,
@@ -390,15 +398,11 @@ class TestCustomTraits:
 
         # Then the trait is created at value 1 and XP is spent
         assert response.status_code == HTTP_201_CREATED
-        assert response.json()["value"] == 1
+        data = response.json()
+        assert data["value"] == 1
         experience = await UserXPService().get_or_create_campaign_experience(player.id, campaign.id)
         assert experience.xp_current == 95
 
-        # Clean up the custom trait since it lives in the constant trait table
-        created_custom_trait_id = response.json()["id"]
-        ct = await CharacterTrait.filter(id=created_custom_trait_id).select_related("trait").first()
-        await ct.trait.delete()
-
 
 class TestDeleteCharacterTrait:
     """Test deleting a character trait."""
@@ -415,6 +419,7 @@ class TestDeleteCharacterTrait:
         character_trait_factory: Callable[..., CharacterTrait],
         token_global_admin: dict[str, str],
         on_behalf_of_header: dict[str, str],
+        seed_trait: Trait,
     ) -> None:
         """Verify that deleting a character trait works."""
         character = await character_factory(
@@ -423,8 +428,7 @@ class TestDeleteCharacterTrait:
             user_creator=session_user,
             campaign=session_campaign,
         )
-        trait = await Trait.filter(is_archived=False).first()
-        character_trait = await character_trait_factory(character=character, trait=trait)
+        character_trait = await character_trait_factory(character=character, trait=seed_trait)
         trait_id = character_trait.trait_id
 
         response = await client.delete(
@@ -506,12 +510,12 @@ class TestDeleteCharacterTrait:
             campaign=session_campaign,
         )
         trait = await Trait.filter(is_archived=False, min_value__gt=0).first()
-        character_trait = await character_trait_factory(
-            value=trait.max_value, trait=trait, character=character
-        )
         initial_xp = 100
         user_svc = UserXPService()
-        await user_svc.add_xp(character_player_user.id, character.campaign_id, initial_xp)
+        character_trait, _ = await asyncio.gather(
+            character_trait_factory(value=trait.max_value, trait=trait, character=character),
+            user_svc.add_xp(character_player_user.id, character.campaign_id, initial_xp),
+        )
 
         # When deleting the trait with XP currency
         # Allow recoup since the new default is DENIED but this test exercises the refund path
@@ -561,11 +565,13 @@ class TestModifyTraitValue:
         character_factory: Callable[..., Character],
         character_trait_factory: Callable[..., CharacterTrait],
         token_global_admin: dict[str, str],
+        seed_trait: Trait,
+        session_users_by_role: dict[UserRole, User],
     ) -> None:
         """Verify increasing a trait value with NO_COST currency."""
         # Given a user whose role determines the permission check, and a character
         # owned by a different user so that PLAYER fails the ownership guard
-        user = await user_factory(role=user_role.value, company=session_company)
+        user = session_users_by_role[user_role]
         character_owner = await user_factory(role=UserRole.PLAYER.value, company=session_company)
         character = await character_factory(
             company=session_company,
@@ -573,8 +579,9 @@ class TestModifyTraitValue:
             user_creator=character_owner,
             campaign=session_campaign,
         )
-        trait = await Trait.filter(is_archived=False).first()
-        character_trait = await character_trait_factory(value=0, trait=trait, character=character)
+        character_trait = await character_trait_factory(
+            value=0, trait=seed_trait, character=character
+        )
 
         # When increasing the trait value with NO_COST
         response = await client.put(
@@ -612,11 +619,13 @@ class TestModifyTraitValue:
         character_factory: Callable[..., Character],
         character_trait_factory: Callable[..., CharacterTrait],
         token_global_admin: dict[str, str],
+        seed_trait: Trait,
+        session_users_by_role: dict[UserRole, User],
     ) -> None:
         """Verify decreasing a trait value with NO_COST currency."""
         # Given a user whose role determines the permission check, and a character
         # owned by a different user so that PLAYER fails the ownership guard
-        user = await user_factory(role=user_role.value, company=session_company)
+        user = session_users_by_role[user_role]
         character_owner = await user_factory(role=UserRole.PLAYER.value, company=session_company)
         character = await character_factory(
             company=session_company,
@@ -624,9 +633,8 @@ class TestModifyTraitValue:
             user_creator=character_owner,
             campaign=session_campaign,
         )
-        trait = await Trait.filter(is_archived=False).first()
         character_trait = await character_trait_factory(
-            value=trait.max_value, trait=trait, character=character
+            value=seed_trait.max_value, trait=seed_trait, character=character
         )
 
         # When decreasing the trait value with NO_COST
@@ -638,7 +646,7 @@ class TestModifyTraitValue:
                 character_trait_id=character_trait.id,
             ),
             headers=token_global_admin | {"On-Behalf-Of": str(user.id)},
-            json={"target_value": trait.max_value - 1, "currency": "NO_COST"},
+            json={"target_value": seed_trait.max_value - 1, "currency": "NO_COST"},
         )
 
         # Then players should be forbidden (they don't own the character),
@@ -648,7 +656,7 @@ class TestModifyTraitValue:
         else:
             assert response.status_code == HTTP_200_OK
             updated_ct = await CharacterTrait.get(id=character_trait.id)
-            assert updated_ct.value == trait.max_value - 1
+            assert updated_ct.value == seed_trait.max_value - 1
 
     async def test_increase_trait_value_with_xp(
         self,
@@ -661,6 +669,7 @@ class TestModifyTraitValue:
         character_factory: Callable[..., Character],
         character_trait_factory: Callable[..., CharacterTrait],
         token_global_admin: dict[str, str],
+        seed_trait: Trait,
     ) -> None:
         """Verify purchasing a trait value increase with XP."""
         # Given a character with XP
@@ -673,10 +682,11 @@ class TestModifyTraitValue:
             user_creator=character_player_user,
             campaign=session_campaign,
         )
-        trait = await Trait.filter(is_archived=False).first()
-        character_trait = await character_trait_factory(value=0, trait=trait, character=character)
         user_svc = UserXPService()
-        await user_svc.add_xp(character_player_user.id, character.campaign_id, 100)
+        character_trait, _ = await asyncio.gather(
+            character_trait_factory(value=0, trait=seed_trait, character=character),
+            user_svc.add_xp(character_player_user.id, character.campaign_id, 100),
+        )
 
         # When purchasing a trait value with XP
         response = await client.put(
@@ -692,16 +702,24 @@ class TestModifyTraitValue:
 
         # Then the response should succeed and XP should be deducted
         assert response.status_code == HTTP_200_OK
-        updated_ct = await CharacterTrait.get(id=character_trait.id)
-        assert updated_ct.value == 1
+        assert response.json()["value"] == 1
         campaign_experience = await user_svc.get_or_create_campaign_experience(
             character_player_user.id, character.campaign_id
         )
-        assert campaign_experience.xp_current == 100 - trait.initial_cost
+        assert campaign_experience.xp_current == 100 - seed_trait.initial_cost
         assert campaign_experience.xp_total == 100
 
-    async def test_increase_trait_value_with_xp_as_storyteller(
+    @pytest.mark.parametrize(
+        ("user_role", "expected_status"),
+        [
+            (UserRole.STORYTELLER, HTTP_200_OK),
+            (UserRole.PLAYER, HTTP_403_FORBIDDEN),
+        ],
+    )
+    async def test_increase_trait_value_with_xp_as_non_owner(
         self,
+        user_role: UserRole,
+        expected_status: int,
         client: AsyncClient,
         build_url: Callable[..., str],
         session_company: Company,
@@ -711,14 +729,13 @@ class TestModifyTraitValue:
         character_factory: Callable[..., Character],
         character_trait_factory: Callable[..., CharacterTrait],
         token_global_admin: dict[str, str],
+        seed_trait: Trait,
     ) -> None:
-        """Verify a storyteller can purchase trait values with XP for any character."""
-        # Given a storyteller and a character owned by another player
-        storyteller_user = await user_factory(
-            role=UserRole.STORYTELLER.value, company=session_company, username="Storyteller User"
-        )
-        character_player_user = await user_factory(
-            role=UserRole.PLAYER.value, company=session_company
+        """Verify only a storyteller can purchase XP trait values on a character they don't own."""
+        # Given a non-owner user and a character owned by another player who has XP
+        acting_user, character_player_user = await asyncio.gather(
+            user_factory(role=user_role.value, company=session_company),
+            user_factory(role=UserRole.PLAYER.value, company=session_company),
         )
         character = await character_factory(
             company=session_company,
@@ -726,60 +743,13 @@ class TestModifyTraitValue:
             user_creator=character_player_user,
             campaign=session_campaign,
         )
-        trait = await Trait.filter(is_archived=False).first()
-        character_trait = await character_trait_factory(value=0, trait=trait, character=character)
         user_svc = UserXPService()
-        await user_svc.add_xp(character_player_user.id, character.campaign_id, 100)
-
-        # When the storyteller purchases a trait value with XP
-        response = await client.put(
-            build_url(
-                Characters.TRAIT_VALUE,
-                company_id=session_company.id,
-                character_id=character.id,
-                character_trait_id=character_trait.id,
-            ),
-            headers=token_global_admin | {"On-Behalf-Of": str(storyteller_user.id)},
-            json={"target_value": 1, "currency": "XP"},
+        character_trait, _ = await asyncio.gather(
+            character_trait_factory(value=0, trait=seed_trait, character=character),
+            user_svc.add_xp(character_player_user.id, character.campaign_id, 100),
         )
 
-        # Then the response should succeed
-        assert response.status_code == HTTP_200_OK
-        updated_ct = await CharacterTrait.get(id=character_trait.id)
-        assert updated_ct.value == 1
-
-    async def test_increase_trait_value_fail_as_non_owner_player(
-        self,
-        client: AsyncClient,
-        build_url: Callable[..., str],
-        session_company: Company,
-        session_global_admin: Any,
-        session_campaign: Any,
-        user_factory: Callable[..., User],
-        character_factory: Callable[..., Character],
-        character_trait_factory: Callable[..., CharacterTrait],
-        token_global_admin: dict[str, str],
-    ) -> None:
-        """Verify a player cannot modify traits on a character they don't own."""
-        # Given a player trying to modify another player's character
-        player_user = await user_factory(
-            role=UserRole.PLAYER.value, company=session_company, username="Player User"
-        )
-        character_player_user = await user_factory(
-            role=UserRole.PLAYER.value, company=session_company
-        )
-        character = await character_factory(
-            company=session_company,
-            user_player=character_player_user,
-            user_creator=character_player_user,
-            campaign=session_campaign,
-        )
-        trait = await Trait.filter(is_archived=False).first()
-        character_trait = await character_trait_factory(value=0, trait=trait, character=character)
-        user_svc = UserXPService()
-        await user_svc.add_xp(character_player_user.id, character.campaign_id, 100)
-
-        # When the non-owner player tries to modify the trait
+        # When the non-owner purchases a trait value with XP
         response = await client.put(
             build_url(
                 Characters.TRAIT_VALUE,
@@ -787,12 +757,14 @@ class TestModifyTraitValue:
                 character_id=character.id,
                 character_trait_id=character_trait.id,
             ),
-            headers=token_global_admin | {"On-Behalf-Of": str(player_user.id)},
+            headers=token_global_admin | {"On-Behalf-Of": str(acting_user.id)},
             json={"target_value": 1, "currency": "XP"},
         )
 
-        # Then the response should be forbidden
-        assert response.status_code == HTTP_403_FORBIDDEN
+        # Then storytellers succeed and players are forbidden
+        assert response.status_code == expected_status
+        updated_ct = await CharacterTrait.get(id=character_trait.id)
+        assert updated_ct.value == (1 if expected_status == HTTP_200_OK else 0)
 
     async def test_decrease_trait_value_with_xp_refund(
         self,
@@ -805,6 +777,7 @@ class TestModifyTraitValue:
         character_factory: Callable[..., Character],
         character_trait_factory: Callable[..., CharacterTrait],
         token_global_admin: dict[str, str],
+        seed_trait: Trait,
     ) -> None:
         """Verify refunding a trait value decrease with XP."""
         # Given a character with a trait at max value
@@ -817,12 +790,13 @@ class TestModifyTraitValue:
             user_creator=character_player_user,
             campaign=session_campaign,
         )
-        trait = await Trait.filter(is_archived=False).first()
-        character_trait = await character_trait_factory(
-            value=trait.max_value, trait=trait, character=character
-        )
         user_svc = UserXPService()
-        await user_svc.add_xp(character_player_user.id, character.campaign_id, 100)
+        character_trait, _ = await asyncio.gather(
+            character_trait_factory(
+                value=seed_trait.max_value, trait=seed_trait, character=character
+            ),
+            user_svc.add_xp(character_player_user.id, character.campaign_id, 100),
+        )
 
         # When refunding a trait value
         # Allow recoup since the new default is DENIED but this test exercises the refund path
@@ -838,7 +812,7 @@ class TestModifyTraitValue:
                     character_trait_id=character_trait.id,
                 ),
                 headers=token_global_admin | {"On-Behalf-Of": str(character_player_user.id)},
-                json={"target_value": trait.max_value - 1, "currency": "XP"},
+                json={"target_value": seed_trait.max_value - 1, "currency": "XP"},
             )
         finally:
             cs.permission_recoup_xp = PermissionsRecoupXP.DENIED
@@ -846,12 +820,13 @@ class TestModifyTraitValue:
 
         # Then the response should succeed and XP should be refunded
         assert response.status_code == HTTP_200_OK
-        updated_ct = await CharacterTrait.get(id=character_trait.id)
-        assert updated_ct.value == trait.max_value - 1
+        assert response.json()["value"] == seed_trait.max_value - 1
         campaign_experience = await user_svc.get_or_create_campaign_experience(
             character_player_user.id, character.campaign_id
         )
-        assert campaign_experience.xp_current == 100 + (trait.initial_cost * trait.max_value)
+        assert campaign_experience.xp_current == 100 + (
+            seed_trait.initial_cost * seed_trait.max_value
+        )
         assert campaign_experience.xp_total == 100
 
     async def test_increase_trait_value_with_starting_points(
@@ -866,6 +841,7 @@ class TestModifyTraitValue:
         character_trait_factory: Callable[..., CharacterTrait],
         token_global_admin: dict[str, str],
         on_behalf_of_header: dict[str, str],
+        seed_trait: Trait,
     ) -> None:
         """Verify purchasing a trait value increase with starting points."""
         # Given a character with starting points
@@ -876,8 +852,9 @@ class TestModifyTraitValue:
             campaign=session_campaign,
             starting_points=100,
         )
-        trait = await Trait.filter(is_archived=False).first()
-        character_trait = await character_trait_factory(value=0, trait=trait, character=character)
+        character_trait = await character_trait_factory(
+            value=0, trait=seed_trait, character=character
+        )
 
         # When purchasing a trait value with starting points
         response = await client.put(
@@ -893,10 +870,11 @@ class TestModifyTraitValue:
 
         # Then the response should succeed and starting points should be deducted
         assert response.status_code == HTTP_200_OK
-        updated_ct = await CharacterTrait.get(id=character_trait.id)
-        assert updated_ct.value == 1
-        updated_character = await Character.get(id=character.id)
-        assert updated_character.starting_points == 100 - trait.initial_cost
+        assert response.json()["value"] == 1
+        starting_points = await Character.get(id=character.id).values_list(
+            "starting_points", flat=True
+        )
+        assert starting_points == 100 - seed_trait.initial_cost
 
     async def test_decrease_trait_value_with_starting_points_refund(
         self,
@@ -910,6 +888,7 @@ class TestModifyTraitValue:
         character_trait_factory: Callable[..., CharacterTrait],
         token_global_admin: dict[str, str],
         on_behalf_of_header: dict[str, str],
+        seed_trait: Trait,
     ) -> None:
         """Verify refunding a trait value decrease with starting points."""
         # Given a character with a trait at max value
@@ -920,9 +899,8 @@ class TestModifyTraitValue:
             campaign=session_campaign,
             starting_points=100,
         )
-        trait = await Trait.filter(is_archived=False).first()
         character_trait = await character_trait_factory(
-            value=trait.max_value, trait=trait, character=character
+            value=seed_trait.max_value, trait=seed_trait, character=character
         )
 
         # When refunding a trait value with starting points
@@ -934,15 +912,16 @@ class TestModifyTraitValue:
                 character_trait_id=character_trait.id,
             ),
             headers=token_global_admin | on_behalf_of_header,
-            json={"target_value": trait.max_value - 1, "currency": "STARTING_POINTS"},
+            json={"target_value": seed_trait.max_value - 1, "currency": "STARTING_POINTS"},
         )
 
         # Then the response should succeed and starting points should be refunded
         assert response.status_code == HTTP_200_OK
-        updated_ct = await CharacterTrait.get(id=character_trait.id)
-        assert updated_ct.value == trait.max_value - 1
-        updated_character = await Character.get(id=character.id)
-        assert updated_character.starting_points == 125
+        assert response.json()["value"] == seed_trait.max_value - 1
+        starting_points = await Character.get(id=character.id).values_list(
+            "starting_points", flat=True
+        )
+        assert starting_points == 125
 
 
 class TestGetValueOptions:
@@ -960,6 +939,7 @@ class TestGetValueOptions:
         character_trait_factory: Callable[..., CharacterTrait],
         token_global_admin: dict[str, str],
         on_behalf_of_header: dict[str, str],
+        seed_trait: Trait,
     ) -> None:
         """Verify getting value options returns correct structure."""
         # Given a character with XP and starting points
@@ -973,10 +953,11 @@ class TestGetValueOptions:
             campaign=session_campaign,
             starting_points=50,
         )
-        trait = await Trait.filter(is_archived=False).first()
-        character_trait = await character_trait_factory(value=2, trait=trait, character=character)
         user_svc = UserXPService()
-        await user_svc.add_xp(character_player_user.id, character.campaign_id, 100)
+        character_trait, _ = await asyncio.gather(
+            character_trait_factory(value=2, trait=seed_trait, character=character),
+            user_svc.add_xp(character_player_user.id, character.campaign_id, 100),
+        )
 
         # When getting value options
         response = await client.get(
@@ -993,7 +974,7 @@ class TestGetValueOptions:
         assert response.status_code == HTTP_200_OK
         result = response.json()
         assert result["current_value"] == 2
-        assert result["trait"]["id"] == str(trait.id)
+        assert result["trait"]["id"] == str(seed_trait.id)
         assert result["xp_current"] == 100
         assert result["starting_points_current"] == 50
         assert "options" in result
@@ -1002,12 +983,12 @@ class TestGetValueOptions:
         assert "2" not in result["options"]
 
         # Should have upgrade options (if not at max)
-        if trait.max_value > 2:
+        if seed_trait.max_value > 2:
             assert "3" in result["options"]
             assert result["options"]["3"]["direction"] == "increase"
 
         # Should have downgrade options (if not at min)
-        if trait.min_value < 2:
+        if seed_trait.min_value < 2:
             assert "1" in result["options"]
             assert result["options"]["1"]["direction"] == "decrease"
 
@@ -1186,14 +1167,14 @@ class TestNpcTraitManagementPermission:
         character_factory: Callable[..., Character],
         character_trait_factory: Callable[..., CharacterTrait],
         token_global_admin: dict[str, str],
+        seed_trait: Trait,
     ) -> None:
         """Verify modifying an NPC trait value respects permission_manage_npc."""
         # Given a company with the NPC permission, an NPC with a trait, and an acting user
         company = await company_factory(settings__permission_manage_npc=permission)
         actor = await user_factory(company=company, role=role.value)
         npc = await character_factory(company=company, type=CharacterType.NPC)
-        trait = await Trait.filter(is_archived=False).first()
-        character_trait = await character_trait_factory(value=0, trait=trait, character=npc)
+        character_trait = await character_trait_factory(value=0, trait=seed_trait, character=npc)
 
         # When increasing the trait value with NO_COST on behalf of the actor
         response = await client.put(
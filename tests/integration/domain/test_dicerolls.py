@@ -145,6 +145,7 @@ class TestDiceRoll:
         character_factory: Callable[..., Any],
         character_trait_factory: Callable[..., Any],
         debug: Callable[[Any], None],
+        seed_trait: Trait,
     ) -> None:
         """Verify creating a dice roll with all fields."""
         # Given a character with traits
@@ -155,7 +156,6 @@ class TestDiceRoll:
             campaign=session_campaign,
         )
         character_trait = await character_trait_factory(character=character)
-        trait = await Trait.filter(is_archived=False).first()
 
         # When we create a dice roll
         response = await client.post(
@@ -172,7 +172,7 @@ class TestDiceRoll:
                 "character_id": str(character.id),
                 "campaign_id": str(session_campaign.id),
                 "comment": "Test comment",
-                "trait_ids": [str(character_trait.id), str(trait.id)],
+                "trait_ids": [str(character_trait.id), str(seed_trait.id)],
             },
         )
 
@@ -20,7 +20,7 @@ from litestar.status_codes import (
 from tortoise.exceptions import DoesNotExist, OperationalError
 
 from vapi.constants import TraitModifyCurrency
-from vapi.db.sql_models.character_sheet import Trait, TraitCategory
+from vapi.db.sql_models.character_sheet import TraitCategory
 from vapi.db.sql_models.developer import Developer as DeveloperModel
 from vapi.domain.urls import Characters as CharacterURL
 from vapi.domain.urls import GlobalAdmin
@@ -33,6 +33,7 @@ if TYPE_CHECKING:
 
     from vapi.db.sql_models.campaign import Campaign
     from vapi.db.sql_models.character import Character, CharacterTrait
+    from vapi.db.sql_models.character_sheet import Trait
     from vapi.db.sql_models.company import Company
     from vapi.db.sql_models.developer import Developer
     from vapi.db.sql_models.user import User
@@ -138,6 +139,7 @@ class TestErrorPipeline:
         token_global_admin: dict[str, str],
         on_behalf_of_header: dict[str, str],
         debug: Callable[[Any], None],
+        seed_trait: Trait,
     ) -> None:
         """Verify ConflictError returns proper HTTP 409 response."""
         # Given a character with a trait already assigned
@@ -146,8 +148,7 @@ class TestErrorPipeline:
             user_player=session_user,
             campaign=session_campaign,
         )
-        trait = await Trait.filter(is_archived=False).first()
-        await character_trait_factory(character=character, trait=trait)
+        await character_trait_factory(character=character, trait=seed_trait)
         trait_category = await TraitCategory.filter(is_archived=False).exclude(name="Flaws").first()
 
         # When we try to create a custom trait with the same name
@@ -159,7 +160,7 @@ class TestErrorPipeline:
             ),
             headers=token_global_admin | on_behalf_of_header,
             json={
-                "name": trait.name,
+                "name": seed_trait.name,
                 "description": "Test Description",
                 "max_value": 5,
                 "min_value": 0,
@@ -1057,9 +1057,9 @@ class TestQuickRollController:
         session_company: Company,
         session_company_user: Developer,
         session_user: User,
+        seed_trait: Trait,
     ) -> None:
         """Verify creating a quick roll returns the new resource."""
-        trait = await Trait.filter(is_archived=False).first()
         response = await client.post(
             build_url(
                 UsersURL.QUICKROLL_CREATE,
@@ -1067,19 +1067,19 @@ class TestQuickRollController:
                 user_id=session_user.id,
             ),
             headers=token_company_user | {"On-Behalf-Of": str(session_user.id)},
-            json={"name": "Quick Roll 1", "trait_ids": [str(trait.id)]},
+            json={"name": "Quick Roll 1", "trait_ids": [str(seed_trait.id)]},
         )
         assert response.status_code == HTTP_201_CREATED
         data = response.json()
 
         assert data["name"] == "Quick Roll 1"
         assert data["user_id"] == str(session_user.id)
-        assert data["trait_ids"] == [str(trait.id)]
+        assert data["trait_ids"] == [str(seed_trait.id)]
 
         # Verify persisted in database
         quickroll = await QuickRoll.get(id=data["id"]).prefetch_related("traits")
         assert quickroll.name == "Quick Roll 1"
-        assert [t.id for t in quickroll.traits] == [trait.id]
+        assert [t.id for t in quickroll.traits] == [seed_trait.id]
 
     async def test_patch_user_quickroll(
         self,
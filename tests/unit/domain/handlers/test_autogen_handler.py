@@ -17,12 +17,7 @@ from vapi.db.sql_models.character import (
 )
 from vapi.db.sql_models.character_classes import VampireClan, WerewolfAuspice, WerewolfTribe
 from vapi.db.sql_models.character_concept import CharacterConcept
-from vapi.db.sql_models.character_sheet import (
-    CharSheetSection,
-    Trait,
-    TraitCategory,
-    TraitSubcategory,
-)
+from vapi.db.sql_models.character_sheet import Trait, TraitCategory, TraitSubcategory
 from vapi.domain.handlers.character_autogeneration.constants import (
     ABILITY_DOT_BONUS,
     ABILITY_FOCUS_DOT_DISTRIBUTION,
@@ -41,38 +36,12 @@ from vapi.domain.handlers.character_autogeneration.constants import (
 from vapi.domain.handlers.character_autogeneration.handler import CharacterAutogenerationHandler
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Awaitable, Callable
 
 
 pytestmark = pytest.mark.anyio
 
 
-async def _all_traits_in_section(section_name: str) -> list[Trait]:
-    """Return all non-archived traits belonging to a character sheet section."""
-    section = await CharSheetSection.filter(name=section_name).first()
-    categories = await TraitCategory.filter(
-        sheet_section_id=section.id,
-        is_archived=False,
-    )
-    return list(
-        await Trait.filter(
-            category_id__in=[c.id for c in categories],
-            is_archived=False,
-        )
-    )
-
-
-async def _all_traits_in_category(category_name: str) -> list[Trait]:
-    """Return all non-archived traits belonging to a trait category."""
-    category = await TraitCategory.filter(name=category_name).first()
-    return list(
-        await Trait.filter(
-            category_id=category.id,
-            is_archived=False,
-        )
-    )
-
-
 class TestGenerateCharacter:
     """Test the generate_character method."""
 
@@ -268,6 +237,7 @@ class TestGenerateAttributeValues:
         user_factory: Callable[..., Any],
         campaign_factory: Callable[..., Any],
         experience_level: AutoGenExperienceLevel,
+        all_traits_in_section: Callable[[str], Awaitable[list[Trait]]],
         debug: Callable[[Any], None],
     ) -> None:
         """Verify attribute values are generated with correct sum for experience level."""
@@ -288,7 +258,7 @@ class TestGenerateAttributeValues:
         await chargen._generate_attribute_values(character)
 
         # Then verify the sum of attribute trait values matches expected distribution
-        attribute_traits = await _all_traits_in_section("Attributes")
+        attribute_traits = await all_traits_in_section("Attributes")
         character_attribute_traits = await CharacterTrait.filter(
             character=character,
             trait_id__in=[trait.id for trait in attribute_traits],
@@ -391,6 +361,7 @@ class TestGenerateAbilityValues:
         campaign_factory: Callable[..., Any],
         experience_level: AutoGenExperienceLevel,
         skill_focus: AbilityFocus,
+        all_traits_in_section: Callable[[str], Awaitable[list[Trait]]],
         debug: Callable[[Any], None],
     ) -> None:
         """Verify ability values are generated with correct sum for experience level and skill focus."""
@@ -413,7 +384,7 @@ class TestGenerateAbilityValues:
         await chargen._generate_ability_values(character)
 
         # Then verify the sum of ability trait values matches expected distribution
-        ability_traits = await _all_traits_in_section("Abilities")
+        ability_traits = await all_traits_in_section("Abilities")
         character_ability_traits = await CharacterTrait.filter(
             character=character,
             trait_id__in=[trait.id for trait in ability_traits],
@@ -476,6 +447,7 @@ class TestGenerateVampireAttributes:
         company_factory: Callable[..., Any],
         user_factory: Callable[..., Any],
         campaign_factory: Callable[..., Any],
+        all_traits_in_category: Callable[[str], Awaitable[list[Trait]]],
         debug: Callable[[Any], None],
     ) -> None:
         """Verify vampire attributes are generated for vampire characters."""
@@ -504,7 +476,7 @@ class TestGenerateVampireAttributes:
         assert vamp_attrs.clan_id in [x.id for x in vampire_clans]
 
         # And verify the disciplines are generated
-        all_disciplines = await _all_traits_in_category("Disciplines")
+        all_disciplines = await all_traits_in_category("Disciplines")
         character_disciplines = await CharacterTrait.filter(
             character=character,
             trait_id__in=[trait.id for trait in all_disciplines],
@@ -529,6 +501,7 @@ class TestGenerateVampireAttributes:
         user_factory: Callable[..., Any],
         campaign_factory: Callable[..., Any],
         experience_level: AutoGenExperienceLevel,
+        all_traits_in_category: Callable[[str], Awaitable[list[Trait]]],
         debug: Callable[[Any], None],
     ) -> None:
         """Verify extra disciplines are generated for vampire characters."""
@@ -551,7 +524,7 @@ class TestGenerateVampireAttributes:
         await chargen._generate_vampire_attributes(character)
 
         # Then verify the extra disciplines are generated
-        all_disciplines = await _all_traits_in_category("Disciplines")
+        all_disciplines = await all_traits_in_category("Disciplines")
         vamp_attrs = await VampireAttributes.filter(character=character).first()
         character_clan = await VampireClan.filter(id=vamp_attrs.clan_id).first()
         await character_clan.fetch_related("disciplines")
@@ -928,6 +901,7 @@ class TestGenerateAdvantageValues:
         user_factory: Callable[..., Any],
         campaign_factory: Callable[..., Any],
         experience_level: AutoGenExperienceLevel,
+        all_traits_in_category: Callable[[str], Awaitable[list[Trait]]],
         debug: Callable[[Any], None],
     ) -> None:
         """Verify advantage values are generated for character."""
@@ -949,8 +923,8 @@ class TestGenerateAdvantageValues:
         await chargen._generate_merit_background_values(character)
 
         # Then verify the advantage values are generated
-        backgrounds = await _all_traits_in_category("Backgrounds")
-        merits = await _all_traits_in_category("Merits")
+        backgrounds = await all_traits_in_category("Backgrounds")
+        merits = await all_traits_in_category("Merits")
         all_traits = backgrounds + merits
         character_traits = await CharacterTrait.filter(
             character=character,
@@ -981,6 +955,7 @@ class TestGenerateFlawValues:
         user_factory: Callable[..., Any],
         campaign_factory: Callable[..., Any],
         experience_level: AutoGenExperienceLevel,
+        all_traits_in_category: Callable[[str], Awaitable[list[Trait]]],
         debug: Callable[[Any], None],
     ) -> None:
         """Verify flaw values are generated for character."""
@@ -1002,7 +977,7 @@ class TestGenerateFlawValues:
         await chargen._generate_flaw_values(character)
 
         # Then verify the flaw values are generated
-        flaws = await _all_traits_in_category("Flaws")
+        flaws = await all_traits_in_category("Flaws")
         character_traits = await CharacterTrait.filter(
             character=character,
             trait_id__in=[trait.id for trait in flaws],